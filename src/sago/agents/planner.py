@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any
 
 from sago.agents.base import AgentResult, AgentStatus, BaseAgent
-from sago.core.parser import MarkdownParser
+from sago.core.parser import MarkdownParser, sanitize_xml
 from sago.core.project import ProjectManager
 from sago.models.plan import Plan
 from sago.utils.tracer import tracer
@@ -149,10 +149,10 @@ Rules:
             [f"=== {name} ===\n{content}" for name, content in project_context.items() if content]
         )
 
-        from sago.utils.environment import PYPROJECT_TEMPLATE, detect_environment
+        from sago.utils.environment import detect_environment, render_pyproject
 
         env = detect_environment()
-        pyproject_example = PYPROJECT_TEMPLATE.replace("{python_version}", env["python_version"])
+        pyproject_example = render_pyproject(env["python_version"])
 
         return f"""Based on the project context below, generate a detailed PLAN.md with atomic tasks.
 
@@ -269,11 +269,8 @@ Generate a complete, executable plan now:"""
 
     def _sanitize_xml(self, xml_str: str) -> str:
         """Fix common XML issues from LLM output (bare &, unescaped chars in text)."""
-        import re as _re
-
         # Replace bare & that aren't already entities (e.g. "TCP & HTTP" but not "&amp;")
-        xml_str = _re.sub(r"&(?!amp;|lt;|gt;|quot;|apos;|#)", "&amp;", xml_str)
-        return xml_str
+        return sanitize_xml(xml_str)
 
     def _validate_xml(self, plan_xml: str) -> None:
         """Validate basic XML structure."""
@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any
 
 from sago.agents.base import AgentResult, AgentStatus, BaseAgent
-from sago.core.parser import MarkdownParser
+from sago.core.parser import MarkdownParser, extract_xml_content, sanitize_xml
 from sago.models.execution import ExecutionHistory
 from sago.models.plan import Plan
 from sago.models.state import TaskStatus
@@ -121,17 +121,10 @@ Rules for modifying the plan:
 
     def _extract_xml(self, content: str) -> str:
         """Extract raw XML from PLAN.md content."""
-        import re
-
-        xml_match = re.search(r"```xml\s*(.*?)\s*```", content, re.DOTALL)
-        if xml_match:
-            return xml_match.group(1)
-
-        raw_match = re.search(r"(<phases\b.*?</phases>)", content, re.DOTALL)
-        if raw_match:
-            return raw_match.group(1)
-
-        raise ValueError("No XML task block found in PLAN.md")
+        xml_content = extract_xml_content(content)
+        if xml_content is None:
+            raise ValueError("No XML task block found in PLAN.md")
+        return xml_content
 
     def _build_state_summary(self, project_path: Path, phases: list[Any]) -> str:
         """Build a summary of task states from STATE.md."""
@@ -309,10 +302,7 @@ Generate the complete updated plan now:""",
 
     def _sanitize_xml(self, xml_str: str) -> str:
         """Fix common XML issues from LLM output."""
-        import re as _re
-
-        xml_str = _re.sub(r"&(?!amp;|lt;|gt;|quot;|apos;|#)", "&amp;", xml_str)
-        return xml_str
+        return sanitize_xml(xml_str)
 
     def _validate_xml(self, plan_xml: str) -> None:
         """Validate basic XML structure."""
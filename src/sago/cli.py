@@ -368,43 +368,78 @@ def _show_status_next_steps(has_plan: bool) -> None:
         console.print("   2. Run: sago plan")
 
 
-def _do_status(project_path: Path, detailed: bool) -> None:
+@dataclass
+class StatusReport:
+    """Project status data, computed separately from its Rich rendering."""
+
+    info: dict[str, Any]
+    has_plan: bool
+    phases: list[Phase] = field(default_factory=list)
+    state: ProjectState | None = None
+    parse_error: str | None = None
+    is_project: bool = True
+
+    @property
+    def tasks(self) -> list[Task]:
+        return [task for phase in self.phases for task in phase.tasks]
+
+    @property
+    def completed(self) -> int:
+        if self.state is None:
+            return 0
+        return sum(1 for ts in self.state.task_states if ts.status == TaskStatus.DONE)
+
+
+def _compute_status(project_path: Path) -> StatusReport:
+    """Gather project status without rendering anything. Non-projects get is_project=False."""
     _load_config(project_path)
     manager = ProjectManager(config)
-    parser = MarkdownParser()
 
     if not manager.is_sago_project(project_path):
-        console.print(f"[red]Not a sago project: {project_path}[/red]")
-        raise typer.Exit(1)
-
-    info = manager.get_project_info(project_path)
-    state_mgr = StateManager(project_path / "STATE.md")
+        return StatusReport(info={}, has_plan=False, is_project=False)
 
     plan_file = project_path / "PLAN.md"
-    phases: list[Phase] = []
-    if plan_file.exists():
+    report = StatusReport(info=manager.get_project_info(project_path), has_plan=plan_file.exists())
+    if report.has_plan:
         try:
-            phases = parser.parse_xml_tasks(plan_file.read_text(encoding="utf-8"))
+            report.phases = MarkdownParser().parse_xml_tasks(plan_file.read_text(encoding="utf-8"))
         except Exception as e:
-            console.print(f"\n[yellow]Could not parse PLAN.md: {e}[/yellow]")
+            report.parse_error = str(e)
+
+    if report.phases:
+        report.state = StateManager(project_path / "STATE.md").get_project_state(report.phases)
+    return report
+
 
-    state = state_mgr.get_project_state(phases) if phases else None
+def _show_status(report: StatusReport, detailed: bool) -> None:
+    """Render a StatusReport to the console."""
+    if report.parse_error is not None:
+        console.print(f"\n[yellow]Could not parse PLAN.md: {report.parse_error}[/yellow]")
 
-    _show_status_overview(info, state)
+    state = report.state
+    _show_status_overview(report.info, state)
 
     if state:
         _show_resume_point(state)
 
-    if phases and state:
-        _show_task_progress(phases, state.task_states, detailed)
-        _show_recommendations(phases, state.task_states)
+    if report.phases and state:
+        _show_task_progress(report.phases, state.task_states, detailed)
+        _show_recommendations(report.phases, state.task_states)
 
     if state and state.blockers:
         console.print("\n[yellow]Known Blockers:[/yellow]")
         for blocker in state.blockers:
             console.print(f"  - {blocker}")
 
-    _show_status_next_steps(plan_file.exists())
+    _show_status_next_steps(report.has_plan)
+
+
+def _do_status(project_path: Path, detailed: bool) -> None:
+    report = _compute_status(project_path)
+    if not report.is_project:
+        console.print(f"[red]Not a sago project: {project_path}[/red]")
+        raise typer.Exit(1)
+    _show_status(report, detailed)
 
 
 @app.command()
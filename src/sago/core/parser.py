@@ -1,52 +1,116 @@
+import io
 import logging
 import re
+import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
+from typing import cast
 
 from sago.models.plan import Phase, Task
 from sago.models.state import Milestone, Requirement
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
 logger = logging.getLogger(__name__)
 
+_XML_FENCE_RE = re.compile(r"```xml\s*(.*?)\s*```", re.DOTALL)
+_RAW_PHASES_RE = re.compile(r"(<phases\b.*?</phases>)", re.DOTALL)
+_BARE_AMP_RE = re.compile(r"&(?!amp;|lt;|gt;|quot;|apos;|#)")
+_REQ_RE = re.compile(r"^\* \[([ x])\] \*\*([A-Z]+-\d+):\*\* (.+)$")
+_REQ_VERSION_RE = re.compile(r"### (V\d+)")
+_MILESTONE_RE = re.compile(r"^\* \[([ x])\] \*\*([^:]+):\*\* (.+)$")
+_ROADMAP_PHASE_RE = re.compile(r"### (.+?)$")
+
+# lxml's libxml2 parser is much faster than stdlib ElementTree; configured to match
+# ElementTree's behaviour (no entity expansion or network access, comments dropped).
+_LXML_PARSER = (
+    _lxml_etree.XMLParser(
+        resolve_entities=False, no_network=True, remove_comments=True, remove_pis=True
+    )
+    if _lxml_etree is not None
+    else None
+)
+
+
+def _fromstring(xml_content: str) -> ET.Element:
+    """Parse XML with lxml when installed, else stdlib ElementTree.
+
+    Always raises ET.ParseError on malformed input, whichever backend is used.
+    """
+    if _LXML_PARSER is None:
+        return ET.fromstring(xml_content)
+    try:
+        root = _lxml_etree.fromstring(xml_content.encode("utf-8"), _LXML_PARSER)
+    except _lxml_etree.XMLSyntaxError as exc:
+        raise ET.ParseError(str(exc)) from exc
+    return cast(ET.Element, root)
+
 
-def _extract_xml_content(content: str) -> str | None:
+def extract_xml_content(content: str) -> str | None:
     """Extract XML content from markdown fenced block or raw <phases> tag.
 
     Returns the XML string, or None if no XML block found.
     """
-    xml_pattern = r"```xml\s*(.*?)\s*```"
-    xml_match = re.search(xml_pattern, content, re.DOTALL)
-
+    xml_match = _XML_FENCE_RE.search(content)
     if xml_match:
         return xml_match.group(1)
 
-    raw_pattern = r"(<phases\b.*?</phases>)"
-    raw_match = re.search(raw_pattern, content, re.DOTALL)
+    raw_match = _RAW_PHASES_RE.search(content)
     if raw_match:
         return raw_match.group(1)
     return None
 
 
-def _sanitize_xml(xml_content: str) -> str:
+def _iterparse(xml_content: str) -> Iterator[tuple[str, ET.Element]]:
+    """Stream (event, element) "start"/"end" pairs with the same backend as _fromstring.
+
+    Raises ET.ParseError on malformed input, whichever backend is used.
+    """
+    data = io.BytesIO(xml_content.encode("utf-8"))
+    if _LXML_PARSER is None:
+        yield from ET.iterparse(data, events=("start", "end"))
+        return
+    try:
+        yield from _lxml_etree.iterparse(
+            data,
+            events=("start", "end"),
+            resolve_entities=False,
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+    except _lxml_etree.XMLSyntaxError as exc:
+        raise ET.ParseError(str(exc)) from exc
+
+
+def sanitize_xml(xml_content: str) -> str:
     """Sanitize bare & in text content (common LLM output issue)."""
-    return re.sub(r"&(?!amp;|lt;|gt;|quot;|apos;|#)", "&amp;", xml_content)
+    return _BARE_AMP_RE.sub("&amp;", xml_content)
 
 
 def _parse_xml_root(xml_content: str) -> ET.Element | None:
     """Parse sanitized XML string into an Element, or None on error."""
-    sanitized = _sanitize_xml(xml_content)
+    sanitized = sanitize_xml(xml_content)
     try:
-        return ET.fromstring(sanitized)
+        return _fromstring(sanitized)
     except ET.ParseError as exc:
         logger.debug("XML parse failed: %s", exc)
         return None
 
 
 def _parse_task_element(task_elem: ET.Element, phase_name: str) -> Task:
-    """Parse a single <task> XML element into a Task model."""
-    task_id = task_elem.get("id", "")
+    """Parse a single <task> XML element into a Task model.
+
+    Task IDs, dependency IDs and file paths are interned: they are used as
+    dict/set keys repeatedly by validation and state tracking.
+    """
+    task_id = sys.intern(task_elem.get("id", ""))
     depends_on_raw = task_elem.get("depends_on", "")
-    depends_on = [d.strip() for d in depends_on_raw.split(",") if d.strip()]
+    depends_on = [sys.intern(d.strip()) for d in depends_on_raw.split(",") if d.strip()]
 
     name_elem = task_elem.find("name")
     files_elem = task_elem.find("files")
@@ -56,7 +120,7 @@ def _parse_task_element(task_elem: ET.Element, phase_name: str) -> Task:
 
     files: list[str] = []
     if files_elem is not None and files_elem.text:
-        files = [f.strip() for f in files_elem.text.strip().split("\n") if f.strip()]
+        files = [sys.intern(f.strip()) for f in files_elem.text.strip().split("\n") if f.strip()]
 
     return Task(
         id=task_id,
@@ -82,17 +146,27 @@ def _parse_phase_element(phase_elem: ET.Element) -> Phase:
 
 class MarkdownParser:
     def parse_xml_tasks(self, content: str) -> list[Phase]:
-        xml_content = _extract_xml_content(content)
+        xml_content = extract_xml_content(content)
         if xml_content is None:
             raise ValueError("No XML task block found in content")
 
-        sanitized = _sanitize_xml(xml_content)
+        # Stream the document and build each top-level <phase> as soon as it
+        # closes, then clear it, so only one phase subtree is held at a time.
+        phases: list[Phase] = []
+        depth = 0
         try:
-            root = ET.fromstring(sanitized)
+            for event, elem in _iterparse(sanitize_xml(xml_content)):
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1 and elem.tag == "phase":
+                    phases.append(_parse_phase_element(elem))
+                    elem.clear()
         except ET.ParseError as e:
             raise ValueError(f"Invalid XML: {e}") from e
 
-        return [_parse_phase_element(pe) for pe in root.findall("phase")]
+        return phases
 
     def parse_requirements(self, content: str) -> list[Requirement]:
         """Parse requirements from REQUIREMENTS.md.
@@ -106,18 +180,16 @@ class MarkdownParser:
         requirements = []
         current_version = "V1"
 
-        req_pattern = r"^\* \[([ x])\] \*\*([A-Z]+-\d+):\*\* (.+)$"
-
         for line in content.split("\n"):
             line = line.strip()
 
             if line.startswith("### V"):
-                version_match = re.match(r"### (V\d+)", line)
+                version_match = _REQ_VERSION_RE.match(line)
                 if version_match:
                     current_version = version_match.group(1)
                 continue
 
-            match = re.match(req_pattern, line)
+            match = _REQ_RE.match(line)
             if match:
                 completed = match.group(1) == "x"
                 req_id = match.group(2)
@@ -146,18 +218,16 @@ class MarkdownParser:
         milestones = []
         current_phase = ""
 
-        milestone_pattern = r"^\* \[([ x])\] \*\*([^:]+):\*\* (.+)$"
-
         for line in content.split("\n"):
             line = line.strip()
 
             if line.startswith("### Phase"):
-                phase_match = re.match(r"### (.+?)$", line)
+                phase_match = _ROADMAP_PHASE_RE.match(line)
                 if phase_match:
                     current_phase = phase_match.group(1)
                 continue
 
-            match = re.match(milestone_pattern, line)
+            match = _MILESTONE_RE.match(line)
             if match:
                 completed = match.group(1) == "x"
                 milestone_id = match.group(2)
@@ -179,7 +249,7 @@ class MarkdownParser:
 
         Returns the review prompt text, or empty string if no <review> tag exists.
         """
-        xml_content = _extract_xml_content(content)
+        xml_content = extract_xml_content(content)
         if xml_content is None:
             return ""
 
@@ -198,7 +268,7 @@ class MarkdownParser:
         Returns e.g. ["flask>=2.0", "requests", "pydantic>=2.0"].
         Returns [] if no <dependencies> element found.
         """
-        xml_content = _extract_xml_content(content)
+        xml_content = extract_xml_content(content)
         if xml_content is None:
             return []
 
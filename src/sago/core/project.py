@@ -9,13 +9,13 @@ logger = logging.getLogger(__name__)
 
 
 class ProjectManager:
-    TEMPLATE_FILES = [
+    TEMPLATE_FILES: tuple[str, ...] = (
         "PROJECT.md",
         "REQUIREMENTS.md",
         "STATE.md",
         "IMPORTANT.md",
         "CLAUDE.md",
-    ]
+    )
 
     def __init__(self, config: Config | None = None) -> None:
         """Initialize ProjectManager.
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+from itertools import chain
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Task(BaseModel):
     """A single atomic task within a phase."""
 
+    # A parsed plan is a read-only snapshot of PLAN.md; frozen rejects field
+    # reassignment only, so list fields must not be mutated in place either
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     files: list[str]
@@ -36,6 +41,8 @@ class Task(BaseModel):
 class Phase(BaseModel):
     """A group of related tasks."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     tasks: list[Task]
@@ -69,7 +76,7 @@ class Plan(BaseModel):
 
     def all_tasks(self) -> list[Task]:
         """Return all tasks across all phases."""
-        return [task for phase in self.phases for task in phase.tasks]
+        return list(chain.from_iterable(phase.tasks for phase in self.phases))
 
     def get_task(self, task_id: str) -> Task | None:
         """Find a task by ID."""
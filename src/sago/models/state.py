@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskStatus(StrEnum):
@@ -28,6 +28,8 @@ class TaskState(BaseModel):
 class ResumePoint(BaseModel):
     """Where to resume execution after interruption."""
 
+    model_config = ConfigDict(frozen=True)
+
     last_completed: str
     next_task: str
     next_action: str
@@ -79,6 +81,8 @@ class ProjectState(BaseModel):
 class Requirement(BaseModel):
     """A single requirement from REQUIREMENTS.md."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     description: str
     completed: bool = False
@@ -96,6 +100,8 @@ class Requirement(BaseModel):
 class Milestone(BaseModel):
     """A milestone from ROADMAP.md."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     phase: str
     description: str
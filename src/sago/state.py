@@ -16,6 +16,25 @@ from sago.models.state import ProjectState, ResumePoint, TaskState, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_PHASE_RE = re.compile(r"\*\s*\*\*Active Phase:\*\*\s*(.*)")
+_CURRENT_TASK_RE = re.compile(r"\*\s*\*\*Current Task:\*\*\s*(.*)")
+_DECISIONS_RE = re.compile(r"## Key Decisions\s*\n(.*?)(?=\n## |\Z)", re.DOTALL)
+_BLOCKERS_RE = re.compile(r"### Known Blockers\s*\n(.*?)(?=\n## |\n### |\Z)", re.DOTALL)
+_RESUME_SECTION_RE = re.compile(r"## Resume Point\s*\n(.*?)(?=\n## |\Z)", re.DOTALL)
+_RESUME_FIELD_RES = {
+    label: re.compile(rf"\*\s*\*\*{re.escape(label)}:\*\*\s*(.*)")
+    for label in ("Last Completed", "Next Task", "Next Action", "Failure Reason", "Checkpoint")
+}
+_DONE_ID_RE = re.compile(r"\[✓\]\s+(\d+\.\d+):")
+_TASK_LINE_ID_RE = re.compile(r"^\[.\]\s+(\d+\.\d+):", re.MULTILINE)
+# Leading horizontal whitespace is allowed, matching the old per-line strip()
+_STATUS_LINE_RE = re.compile(r"^[^\S\n]*\[([✓✗⊘])\]\s+(\d+\.\d+):", re.MULTILINE)
+_STATUS_MARKERS = {
+    "✓": TaskStatus.DONE,
+    "✗": TaskStatus.FAILED,
+    "⊘": TaskStatus.SKIPPED,
+}
+
 
 @dataclass
 class CheckpointResult:
@@ -61,26 +80,21 @@ class StateManager:
 
     @staticmethod
     def _parse_status_ids(content: str) -> dict[str, TaskStatus]:
-        """Parse STATE.md content and return a mapping of task ID to status."""
-        status_map: dict[str, TaskStatus] = {}
-        markers = {
-            "✓": TaskStatus.DONE,
-            "✗": TaskStatus.FAILED,
-            "⊘": TaskStatus.SKIPPED,
-        }
-        for line in content.split("\n"):
-            line = line.strip()
-            m = re.match(r"\[([✓✗⊘])\]\s+(\d+\.\d+):", line)
-            if m:
-                status_map[m.group(2)] = markers[m.group(1)]
-        return status_map
+        """Parse STATE.md content and return a mapping of task ID to status.
+
+        One regex pass over the whole document; later lines win for repeated IDs.
+        """
+        return {m.group(2): _STATUS_MARKERS[m.group(1)] for m in _STATUS_LINE_RE.finditer(content)}
 
     def get_task_states(self, plan_phases: list[Phase]) -> list[TaskState]:
         """Parse STATE.md and return status for every task in the plan.
 
         Tasks not mentioned in STATE.md default to PENDING.
         """
-        status_map = self._parse_status_ids(self._read())
+        return self._task_states(self._read(), plan_phases)
+
+    def _task_states(self, content: str, plan_phases: list[Phase]) -> list[TaskState]:
+        status_map = self._parse_status_ids(content)
         return [
             TaskState(
                 task_id=task.id,
@@ -93,7 +107,7 @@ class StateManager:
     def completed_task_ids(self) -> list[str]:
         """Return list of completed (done) task IDs from STATE.md."""
         content = self._read()
-        return re.findall(r"\[✓\]\s+(\d+\.\d+):", content)
+        return _DONE_ID_RE.findall(content)
 
     def get_project_state(self, plan_phases: list[Phase]) -> ProjectState:
         """Parse STATE.md into a fully-populated ProjectState model.
@@ -106,16 +120,16 @@ class StateManager:
         # Parse Current Context
         active_phase = ""
         current_task = ""
-        m = re.search(r"\*\s*\*\*Active Phase:\*\*\s*(.*)", content)
+        m = _ACTIVE_PHASE_RE.search(content)
         if m:
             active_phase = m.group(1).strip()
-        m = re.search(r"\*\s*\*\*Current Task:\*\*\s*(.*)", content)
+        m = _CURRENT_TASK_RE.search(content)
         if m:
             current_task = m.group(1).strip()
 
         # Parse decisions
         decisions: list[str] = []
-        dec_match = re.search(r"## Key Decisions\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
+        dec_match = _DECISIONS_RE.search(content)
         if dec_match:
             for line in dec_match.group(1).split("\n"):
                 line = line.strip()
@@ -124,9 +138,7 @@ class StateManager:
 
         # Parse blockers
         blockers: list[str] = []
-        blk_match = re.search(
-            r"### Known Blockers\s*\n(.*?)(?=\n## |\n### |\Z)", content, re.DOTALL
-        )
+        blk_match = _BLOCKERS_RE.search(content)
         if blk_match:
             for line in blk_match.group(1).split("\n"):
                 line = line.strip()
@@ -136,29 +148,26 @@ class StateManager:
         return ProjectState(
             active_phase=active_phase,
             current_task=current_task,
-            task_states=self.get_task_states(plan_phases),
+            task_states=self._task_states(content, plan_phases),
             decisions=decisions,
             blockers=blockers,
-            resume_point=self.get_resume_point(),
+            resume_point=self._resume_point(content),
         )
 
     def get_resume_point(self) -> ResumePoint | None:
         """Read and return the current resume point, or None."""
-        content = self._read()
-        match = re.search(r"## Resume Point\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
+        return self._resume_point(self._read())
+
+    @staticmethod
+    def _resume_point(content: str) -> ResumePoint | None:
+        match = _RESUME_SECTION_RE.search(content)
         if not match:
             return None
 
         section = match.group(1)
         fields: dict[str, str] = {}
-        for label in (
-            "Last Completed",
-            "Next Task",
-            "Next Action",
-            "Failure Reason",
-            "Checkpoint",
-        ):
-            m = re.search(rf"\*\s*\*\*{re.escape(label)}:\*\*\s*(.*)", section)
+        for label, field_re in _RESUME_FIELD_RES.items():
+            m = field_re.search(section)
             fields[label] = m.group(1).strip() if m else "None"
 
         if all(v == "None" for v in fields.values()):
@@ -187,13 +196,13 @@ class StateManager:
                 result.valid = False
 
         # Check for duplicate task lines
-        task_ids: list[str] = []
-        for m in re.finditer(r"^\[.\]\s+(\d+\.\d+):", content, re.MULTILINE):
+        seen_ids: set[str] = set()
+        for m in _TASK_LINE_ID_RE.finditer(content):
             tid = m.group(1)
-            if tid in task_ids:
+            if tid in seen_ids:
                 result.warnings.append(f"Duplicate task entry: {tid}")
                 result.valid = False
-            task_ids.append(tid)
+            seen_ids.add(tid)
 
         return result
 
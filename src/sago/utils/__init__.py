@@ -5,6 +5,7 @@ from sago.utils.environment import (
     PYPROJECT_TEMPLATE,
     detect_environment,
     format_environment_context,
+    render_pyproject,
 )
 from sago.utils.git_integration import GitIntegration
 from sago.utils.repo_map import generate_repo_map
@@ -17,6 +18,7 @@ __all__ = [
     "PYPROJECT_TEMPLATE",
     "detect_environment",
     "format_environment_context",
+    "render_pyproject",
     "GitIntegration",
     "SyntaxCheckResult",
     "check_python_syntax",
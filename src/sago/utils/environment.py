@@ -1,16 +1,25 @@
-import platform
+import functools
+import string
 import sys
 
 
-def detect_environment() -> dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def _probe_environment() -> tuple[tuple[str, str], ...]:
+    # platform.architecture() may shell out to `file`; the answer is fixed per process.
+    import platform
+
     ver = sys.version_info
-    return {
-        "python_version": f"{ver.major}.{ver.minor}",
-        "python_full_version": f"{ver.major}.{ver.minor}.{ver.micro}",
-        "os": platform.system(),
-        "platform": platform.machine(),
-        "architecture": platform.architecture()[0],
-    }
+    return (
+        ("python_version", f"{ver.major}.{ver.minor}"),
+        ("python_full_version", f"{ver.major}.{ver.minor}.{ver.micro}"),
+        ("os", platform.system()),
+        ("platform", platform.machine()),
+        ("architecture", platform.architecture()[0]),
+    )
+
+
+def detect_environment() -> dict[str, str]:
+    return dict(_probe_environment())
 
 
 def format_environment_context(env: dict[str, str]) -> str:
@@ -38,3 +47,11 @@ dependencies = [
 [tool.setuptools.packages.find]
 where = ["src"]
 """
+
+_PYPROJECT_TEMPLATE_OBJ = string.Template(
+    PYPROJECT_TEMPLATE.replace("{python_version}", "$python_version")
+)
+
+
+def render_pyproject(python_version: str) -> str:
+    return _PYPROJECT_TEMPLATE_OBJ.substitute(python_version=python_version)
@@ -1,19 +1,79 @@
 import logging
+import os
+import select
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 _GIT_TIMEOUT = 30  # seconds
 
+# pidfd_open needs Linux >= 5.3; os.pidfd_open only exists where the platform has it
+_HAS_PIDFD = sys.platform == "linux" and hasattr(os, "pidfd_open")
+
+
+def _run_with_pidfd(cmd: list[str], cwd: Path, timeout: float) -> subprocess.CompletedProcess[str]:
+    """Run cmd like subprocess.run(check=True), waiting on a pidfd instead of polling.
+
+    Used for long-running network operations. Output goes to temp files so a
+    chatty child can never block on a full pipe while we wait for it to exit.
+    Falls back to subprocess.run where pidfds are unavailable.
+    """
+    if not _HAS_PIDFD:
+        return subprocess.run(
+            cmd, cwd=cwd, capture_output=True, text=True, check=True, timeout=timeout
+        )
+
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=out, stderr=err)
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None
+
+        if pidfd is None:
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                exited = poller.poll(timeout * 1000)
+            finally:
+                os.close(pidfd)
+            if not exited:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            proc.wait()
+
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode("utf-8", errors="replace")
+        stderr = err.read().decode("utf-8", errors="replace")
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
 
 class GitIntegration:
     def __init__(self, project_path: Path) -> None:
         self.project_path = Path(project_path)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._is_repo = False
 
     def is_git_repo(self) -> bool:
-        return (self.project_path / ".git").exists()
+        # Only a positive answer is cached; a repo can appear but not vanish under us
+        if not self._is_repo:
+            self._is_repo = (self.project_path / ".git").exists()
+        return self._is_repo
 
     def init_repo(self) -> bool:
         if self.is_git_repo():
@@ -29,6 +89,7 @@ class GitIntegration:
                 check=True,
                 timeout=_GIT_TIMEOUT,
             )
+            self._is_repo = True
             self.logger.info("Initialized Git repository")
             return True
 
@@ -52,9 +113,9 @@ class GitIntegration:
     def _do_create_commit(
         self, task_id: str, task_name: str, files: list[str], message: str | None
     ) -> bool:
-        for file_path in files:
+        if files:
             subprocess.run(
-                ["git", "add", file_path],
+                ["git", "add", "--", *files],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
@@ -62,34 +123,49 @@ class GitIntegration:
                 timeout=_GIT_TIMEOUT,
             )
 
-        status_result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=_GIT_TIMEOUT,
-        )
-
-        if not status_result.stdout.strip():
-            self.logger.info("No changes to commit")
-            return True
-
         if not message:
             message = self._generate_commit_message(task_id, task_name, files)
 
-        subprocess.run(
+        # No up-front status probe: commit directly, and only on failure ask
+        # `git diff --cached --quiet` (exit 0 == empty index) whether there was
+        # anything to commit. Exit codes are locale-independent, unlike output text.
+        commit_result = subprocess.run(
             ["git", "commit", "-m", message],
             cwd=self.project_path,
             capture_output=True,
             text=True,
-            check=True,
+            check=False,
             timeout=_GIT_TIMEOUT,
         )
 
+        if commit_result.returncode != 0:
+            if not self._has_staged_changes():
+                self.logger.info("No changes to commit")
+                return True
+            raise subprocess.CalledProcessError(
+                commit_result.returncode,
+                commit_result.args,
+                output=commit_result.stdout,
+                stderr=commit_result.stderr,
+            )
+
         self.logger.info(f"Created commit for task {task_id}")
         return True
 
+    def _has_staged_changes(self) -> bool:
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--quiet"],
+            cwd=self.project_path,
+            capture_output=True,
+            check=False,
+            timeout=_GIT_TIMEOUT,
+        )
+        if result.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, output=result.stdout, stderr=result.stderr
+            )
+        return result.returncode == 1
+
     def _generate_commit_message(self, task_id: str, task_name: str, files: list[str]) -> str:
         lines = [
             f"✅ {task_id}: {task_name}",
@@ -150,12 +226,9 @@ class GitIntegration:
             return False
 
         try:
-            subprocess.run(
+            _run_with_pidfd(
                 ["git", "push", "-u", "origin", branch_name],
                 cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                check=True,
                 timeout=_GIT_TIMEOUT,
             )
 
@@ -275,16 +275,17 @@ class LLMClient:
         response: Any,
         callback: Callable[[str], None] | None,
     ) -> dict[str, Any]:
-        response_text = ""
+        parts: list[str] = []
         finish_reason = None
         model_used = self.model
         stream_usage = None
 
         for chunk in response:
-            response_text, finish_reason, model_used, stream_usage = self._process_chunk(
-                chunk, response_text, finish_reason, model_used, stream_usage, callback
+            finish_reason, model_used, stream_usage = self._process_chunk(
+                chunk, parts, finish_reason, model_used, stream_usage, callback
             )
 
+        response_text = "".join(parts)
         if stream_usage is None:
             stream_usage = self._estimate_usage(response_text)
 
@@ -300,16 +301,17 @@ class LLMClient:
         response: Any,
         callback: Callable[[str], None] | None,
     ) -> dict[str, Any]:
-        response_text = ""
+        parts: list[str] = []
         finish_reason = None
         model_used = self.model
         stream_usage = None
 
         async for chunk in response:
-            response_text, finish_reason, model_used, stream_usage = self._process_chunk(
-                chunk, response_text, finish_reason, model_used, stream_usage, callback
+            finish_reason, model_used, stream_usage = self._process_chunk(
+                chunk, parts, finish_reason, model_used, stream_usage, callback
             )
 
+        response_text = "".join(parts)
         if stream_usage is None:
             stream_usage = self._estimate_usage(response_text)
 
@@ -323,15 +325,17 @@ class LLMClient:
     def _process_chunk(
         self,
         chunk: Any,
-        response_text: str,
+        parts: list[str],
         finish_reason: str | None,
         model_used: str,
         stream_usage: dict[str, int] | None,
         callback: Callable[[str], None] | None,
-    ) -> tuple[str, str | None, str, dict[str, int] | None]:
+    ) -> tuple[str | None, str, dict[str, int] | None]:
+        # Content is accumulated into ``parts`` and joined once by the caller,
+        # avoiding quadratic ``str +=`` on long streamed responses.
         if chunk.choices and chunk.choices[0].delta.content:
             content = chunk.choices[0].delta.content
-            response_text += content
+            parts.append(content)
             if callback:
                 callback(content)
 
@@ -348,7 +352,7 @@ class LLMClient:
                 "total_tokens": getattr(chunk.usage, "total_tokens", 0),
             }
 
-        return response_text, finish_reason, model_used, stream_usage
+        return finish_reason, model_used, stream_usage
 
     def _estimate_usage(self, response_text: str) -> dict[str, int]:
         completion_tokens = self.count_tokens(response_text)
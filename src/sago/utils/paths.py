@@ -1,11 +1,26 @@
 """Path safety utilities for preventing traversal attacks."""
 
-from pathlib import Path
+import os
+from pathlib import Path, PureWindowsPath
+
+
+def _is_rooted(relative: str) -> bool:
+    """True for POSIX/UNC-rooted paths, and on Windows for drive paths like ``C:...``.
+
+    On POSIX ``c:notes.md`` is an ordinary file name, so drives are only checked on Windows.
+    """
+    if relative[0] in "/\\":
+        return True
+    return os.name == "nt" and bool(PureWindowsPath(relative).drive)
 
 
 def safe_resolve(project_path: Path, relative: str) -> Path:
     """Resolve a relative path, ensuring it stays within project_path.
 
+    Rooted paths are rejected outright and ``..`` escapes by a lexical check on
+    the normalized path, neither touching the filesystem; paths that pass are
+    then resolved, so symlinks pointing out of the project are still caught.
+
     Args:
         project_path: The root project directory.
         relative: A relative file path (e.g. from LLM output).
@@ -14,8 +29,21 @@ def safe_resolve(project_path: Path, relative: str) -> Path:
         The resolved absolute Path.
 
     Raises:
-        ValueError: If the resolved path escapes project_path.
+        ValueError: If the path is absolute or the resolved path escapes project_path.
     """
+    if not relative:
+        return project_path.resolve()
+    if _is_rooted(relative):
+        raise ValueError(f"Path traversal blocked: {relative!r}")
+
+    # Without a ".." segment a relative path cannot climb out lexically
+    if ".." in relative.replace("\\", "/").split("/"):
+        base = os.path.normpath(os.path.abspath(project_path))
+        joined = os.path.normpath(os.path.join(base, relative))
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        if joined != base and not joined.startswith(prefix):
+            raise ValueError(f"Path traversal blocked: {relative!r}")
+
     resolved = (project_path / relative).resolve()
     if not resolved.is_relative_to(project_path.resolve()):
         raise ValueError(f"Path traversal blocked: {relative!r}")
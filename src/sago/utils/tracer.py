@@ -9,7 +9,7 @@ from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 
 @dataclass
@@ -58,32 +58,65 @@ class Tracer:
         self._enabled = False
         self._lock = threading.Lock()
         self._file: Any = None
+        self._owns_file = True
+        self._flush_each = True
         self._trace_id: str = ""
         self._model: str = ""
         self._span_stack: threading.local = threading.local()
 
     def configure(
         self,
-        trace_path: Path,
+        trace_path: Path | None = None,
         model: str = "",
+        write_buffer_bytes: int = 0,
+        sink: IO[bytes] | None = None,
     ) -> None:
+        """Start writing events to ``trace_path``, or to ``sink`` if one is given.
+
+        By default every event is flushed as it is emitted so ``sago watch`` can tail
+        the file live. A positive ``write_buffer_bytes`` batches events in a buffer of
+        that size instead; they reach disk when it fills, on ``flush()`` or on ``close()``.
+        A ``sink`` is any binary file-like object; it is flushed but never closed.
+        """
+        if (trace_path is None) == (sink is None):
+            raise ValueError("Pass exactly one of trace_path or sink")
         with self._lock:
-            if self._file is not None:
-                self._file.close()
-            safe_path = Path(trace_path).resolve()
-            safe_path.parent.mkdir(parents=True, exist_ok=True)
-            self._file = safe_path.open("a", encoding="utf-8")
+            self._release_file()
+            if trace_path is not None:
+                safe_path = Path(trace_path).resolve()
+                safe_path.parent.mkdir(parents=True, exist_ok=True)
+                buffering = write_buffer_bytes if write_buffer_bytes > 0 else -1
+                self._file = safe_path.open("ab", buffering=buffering)
+                self._owns_file = True
+            else:
+                self._file = sink
+                self._owns_file = False
+            self._flush_each = write_buffer_bytes <= 0
             self._trace_id = uuid.uuid4().hex[:16]
             self._model = model
             self._enabled = True
 
-    def close(self) -> None:
+    def flush(self) -> None:
+        """Push any buffered events to disk."""
         with self._lock:
             if self._file is not None:
-                self._file.close()
-                self._file = None
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._release_file()
             self._enabled = False
 
+    def _release_file(self) -> None:
+        """Close an owned trace file, or just flush a caller's sink. Caller holds the lock."""
+        if self._file is None:
+            return
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+
     def reset(self) -> None:
         self.close()
         with self._lock:
@@ -123,8 +156,10 @@ class Tracer:
 
         with self._lock:
             if self._file is not None:
-                self._file.write(event.to_json() + "\n")
-                self._file.flush()
+                # One write per record keeps lines whole even when buffered
+                self._file.write((event.to_json() + "\n").encode("utf-8"))
+                if self._flush_each:
+                    self._file.flush()
 
         return event
 
@@ -8,7 +8,7 @@ from enum import StrEnum
 
 from pydantic import BaseModel
 
-from sago.models.plan import Plan
+from sago.models.plan import Plan, Task
 
 # Commands that should never appear in verify fields.
 # Matched against the first token of each command in a pipeline.
@@ -143,28 +143,30 @@ class PlanValidator:
 
     def validate(self, plan: Plan) -> ValidationResult:
         """Run all validation checks and return results."""
+        # Flatten once and share across the per-task checks
+        tasks = plan.all_tasks()
         issues: list[ValidationIssue] = []
-        issues.extend(self._check_missing_task_ids(plan))
-        issues.extend(self._check_duplicate_task_ids(plan))
-        issues.extend(self._check_invalid_dependency_refs(plan))
-        issues.extend(self._check_dependency_cycles(plan))
-        issues.extend(self._check_empty_action(plan))
-        issues.extend(self._check_empty_files(plan))
-        issues.extend(self._check_cross_phase_backward_deps(plan))
-        issues.extend(self._check_empty_verify(plan))
-        issues.extend(self._check_missing_done(plan))
-        issues.extend(self._check_broad_tasks(plan))
+        issues.extend(self._check_missing_task_ids(tasks))
+        issues.extend(self._check_duplicate_task_ids(tasks))
+        issues.extend(self._check_invalid_dependency_refs(tasks))
+        issues.extend(self._check_dependency_cycles(tasks))
+        issues.extend(self._check_empty_action(tasks))
+        issues.extend(self._check_empty_files(tasks))
+        issues.extend(self._check_cross_phase_backward_deps(plan, tasks))
+        issues.extend(self._check_empty_verify(tasks))
+        issues.extend(self._check_missing_done(tasks))
+        issues.extend(self._check_broad_tasks(tasks))
         issues.extend(self._check_duplicate_files_in_phase(plan))
-        issues.extend(self._check_too_many_files(plan))
+        issues.extend(self._check_too_many_files(tasks))
         issues.extend(self._check_single_task_phase(plan))
         issues.extend(self._check_large_phase(plan))
-        issues.extend(self._check_over_specified_deps(plan))
-        issues.extend(self._check_dangerous_verify(plan))
+        issues.extend(self._check_over_specified_deps(tasks))
+        issues.extend(self._check_dangerous_verify(tasks))
         return ValidationResult(issues=issues)
 
-    def _check_missing_task_ids(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_missing_task_ids(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.id or not task.id.strip():
                 issues.append(
                     ValidationIssue(
@@ -176,10 +178,10 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_duplicate_task_ids(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_duplicate_task_ids(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
         seen: dict[str, str] = {}
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.id:
                 continue
             if task.id in seen:
@@ -196,10 +198,10 @@ class PlanValidator:
                 seen[task.id] = task.phase_name
         return issues
 
-    def _check_invalid_dependency_refs(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_invalid_dependency_refs(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        valid_ids = plan.task_ids()
-        for task in plan.all_tasks():
+        valid_ids = {task.id for task in tasks}
+        for task in tasks:
             for dep_id in task.depends_on:
                 if dep_id not in valid_ids:
                     issues.append(
@@ -213,35 +215,38 @@ class PlanValidator:
                     )
         return issues
 
-    def _check_dependency_cycles(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_dependency_cycles(self, tasks: list[Task]) -> list[ValidationIssue]:
         """Detect cycles using topological sort (Kahn's algorithm)."""
-        graph = plan.dependency_graph()
-        all_ids = plan.task_ids()
+        graph = {task.id: task.depends_on for task in tasks}
+        all_ids = set(graph)
 
         if not all_ids:
             return []
 
-        # Build in-degree map
+        # Build in-degree map; sets collapse repeated depends_on entries
         in_degree: dict[str, int] = dict.fromkeys(all_ids, 0)
-        adjacency: dict[str, list[str]] = {tid: [] for tid in all_ids}
+        adjacency: dict[str, set[str]] = defaultdict(set)
 
         for tid, deps in graph.items():
-            for dep in deps:
-                if dep in all_ids:
-                    adjacency[dep].append(tid)
-                    in_degree[tid] += 1
-
-        # Kahn's algorithm
-        queue = [tid for tid, deg in in_degree.items() if deg == 0]
+            known_deps = all_ids.intersection(deps)
+            for dep in known_deps:
+                adjacency[dep].add(tid)
+            in_degree[tid] += len(known_deps)
+
+        # Kahn's algorithm, one wave of ready tasks at a time — iterative, so
+        # deep dependency chains never recurse
+        wave = [tid for tid, deg in in_degree.items() if deg == 0]
         visited = 0
 
-        while queue:
-            node = queue.pop(0)
-            visited += 1
-            for neighbor in adjacency[node]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        while wave:
+            visited += len(wave)
+            next_wave: list[str] = []
+            for node in wave:
+                for neighbor in adjacency[node]:
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        next_wave.append(neighbor)
+            wave = next_wave
 
         if visited < len(all_ids):
             cycle_ids = [tid for tid, deg in in_degree.items() if deg > 0]
@@ -254,9 +259,9 @@ class PlanValidator:
             ]
         return []
 
-    def _check_empty_action(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_empty_action(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.action or not task.action.strip():
                 issues.append(
                     ValidationIssue(
@@ -269,9 +274,9 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_empty_files(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_empty_files(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.files:
                 issues.append(
                     ValidationIssue(
@@ -284,7 +289,9 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_cross_phase_backward_deps(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_cross_phase_backward_deps(
+        self, plan: Plan, tasks: list[Task]
+    ) -> list[ValidationIssue]:
         """Check for tasks that depend on tasks in later phases."""
         issues = []
         phase_order: dict[str, int] = {}
@@ -295,7 +302,7 @@ class PlanValidator:
             for task in phase.tasks:
                 task_phase[task.id] = i
 
-        for task in plan.all_tasks():
+        for task in tasks:
             task_idx = task_phase.get(task.id, 0)
             for dep_id in task.depends_on:
                 dep_idx = task_phase.get(dep_id)
@@ -313,9 +320,9 @@ class PlanValidator:
 
     # --- Warnings ---
 
-    def _check_empty_verify(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_empty_verify(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.verify or not task.verify.strip():
                 issues.append(
                     ValidationIssue(
@@ -328,9 +335,9 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_missing_done(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_missing_done(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if not task.done or not task.done.strip():
                 issues.append(
                     ValidationIssue(
@@ -343,9 +350,9 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_broad_tasks(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_broad_tasks(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if len(task.action) > 2000:
                 issues.append(
                     ValidationIssue(
@@ -377,9 +384,9 @@ class PlanValidator:
                     )
         return issues
 
-    def _check_too_many_files(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_too_many_files(self, tasks: list[Task]) -> list[ValidationIssue]:
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             if len(task.files) > 8:
                 issues.append(
                     ValidationIssue(
@@ -392,10 +399,10 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_dangerous_verify(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_dangerous_verify(self, tasks: list[Task]) -> list[ValidationIssue]:
         """Flag verify commands that contain dangerous or suspicious patterns."""
         issues = []
-        for task in plan.all_tasks():
+        for task in tasks:
             warnings = check_verify_safety(task.verify)
             for warning in warnings:
                 issues.append(
@@ -439,13 +446,12 @@ class PlanValidator:
                 )
         return issues
 
-    def _check_over_specified_deps(self, plan: Plan) -> list[ValidationIssue]:
+    def _check_over_specified_deps(self, tasks: list[Task]) -> list[ValidationIssue]:
         """Flag tasks that depend on all prior tasks (probably over-specified)."""
         issues = []
-        all_tasks = plan.all_tasks()
         # Build prior_ids incrementally to avoid O(N²) set rebuilding
         prior_ids: set[str] = set()
-        for i, task in enumerate(all_tasks):
+        for i, task in enumerate(tasks):
             if i >= 2 and prior_ids:
                 deps_set = set(task.depends_on)
                 if len(deps_set) >= len(prior_ids) and prior_ids.issubset(deps_set):
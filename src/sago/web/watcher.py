@@ -163,6 +163,8 @@ class _IgnoreFilter:
 
     literal_names: frozenset[str]
     glob_patterns: tuple[str, ...]
+    # Every poll re-checks the same tracked paths, so remember each decision
+    _decisions: dict[str, bool] = field(default_factory=dict, init=False, repr=False)
 
     @classmethod
     def from_patterns(cls, patterns: list[str]) -> _IgnoreFilter:
@@ -177,6 +179,12 @@ class _IgnoreFilter:
 
     def is_ignored(self, rel_path: str) -> bool:
         """Check if a relative path matches any ignore pattern."""
+        ignored = self._decisions.get(rel_path)
+        if ignored is None:
+            ignored = self._decisions[rel_path] = self._matches(rel_path)
+        return ignored
+
+    def _matches(self, rel_path: str) -> bool:
         parts = rel_path.split(os.sep)
         # O(1) lookup for literal names against each path component
         for part in parts:
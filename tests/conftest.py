@@ -1,9 +1,33 @@
 """Shared fixtures for sago tests."""
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep test startup offline and register the slow marker."""
+    # Use litellm's bundled model cost map; otherwise importing it fetches the map over the
+    # network and retries in a background thread.
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    config.addinivalue_line("markers", "slow: long-running stress test, only run with --runslow")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 SAMPLE_XML = """\
 <phases>
     <phase name="Phase 1: Foundation">
@@ -83,3 +107,34 @@ def sago_project_with_plan(sago_project: Path) -> Path:
     """Sago project that also has a PLAN.md."""
     (sago_project / "PLAN.md").write_text(SAMPLE_PLAN)
     return sago_project
+
+
+@pytest.fixture(scope="session")
+def _initialized_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run `sago init` once per session; tests get copies via initialized_project."""
+    from typer.testing import CliRunner
+
+    from sago.cli import app
+
+    root = tmp_path_factory.mktemp("sago_init") / "tpl"
+    result = CliRunner().invoke(app, ["init", "tpl", "--path", str(root), "--yes"])
+    assert result.exit_code == 0, result.output
+    return root
+
+
+@pytest.fixture
+def initialized_project(_initialized_template: Path, tmp_path: Path) -> Path:
+    """A fresh copy of a project created by `sago init`.
+
+    Use this instead of calling ``init_project`` in tests that only need an
+    initialized project; copying is much cheaper than re-rendering templates.
+    """
+    return Path(shutil.copytree(_initialized_template, tmp_path / "project"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Import the heavy agent stack up front so the first test's timing excludes it."""
+    import sago.agents.base  # noqa: F401
+    import sago.agents.orchestrator  # noqa: F401
+    import sago.core.parser  # noqa: F401
@@ -6,6 +6,7 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 
 from sago.cli import app
+from sago.cli import config as cli_config
 
 runner = CliRunner()
 
@@ -32,10 +33,14 @@ def test_init_with_yes_flag(tmp_path: Path) -> None:
 def test_init_with_prompt_no_llm(tmp_path: Path) -> None:
     """init --prompt should fail gracefully when no API key is configured."""
     project_path = tmp_path / "prompted"
-    runner.invoke(
-        app,
-        ["init", "prompted", "--path", str(project_path), "--yes", "--prompt", "a todo app"],
-    )
+    # Blank the key even if the environment provides one, so no real request (and no
+    # client-side retry backoff) happens.
+    with patch.object(cli_config, "llm_api_key", ""):
+        result = runner.invoke(
+            app,
+            ["init", "prompted", "--path", str(project_path), "--yes", "--prompt", "a todo app"],
+        )
+    assert "Missing API Key" in result.output
     # Should still create the project (with placeholder files) even if prompt generation fails
     assert (project_path / "PROJECT.md").exists()
 
@@ -78,6 +83,17 @@ def test_status_detailed(sago_project_with_plan: Path) -> None:
     result = runner.invoke(app, ["status", "--path", str(sago_project_with_plan), "--detailed"])
     assert result.exit_code == 0
     assert "Task Progress" in result.output
+    assert "Phases:" in result.output
+    assert "Phase 1: Foundation (1/2)" in result.output
+    assert "1.1: Create config" in result.output
+    assert "1.2: Create main" in result.output
+
+
+def test_status_without_detailed_omits_phases(sago_project_with_plan: Path) -> None:
+    result = runner.invoke(app, ["status", "--path", str(sago_project_with_plan)])
+    assert result.exit_code == 0
+    assert "Completed: 1/2 tasks" in result.output
+    assert "Phases:" not in result.output
 
 
 def test_replan_on_non_sago_project(tmp_path: Path) -> None:
@@ -4,6 +4,7 @@ from sago.utils.environment import (
     PYPROJECT_TEMPLATE,
     detect_environment,
     format_environment_context,
+    render_pyproject,
 )
 
 
@@ -33,6 +34,12 @@ def test_detect_environment_python_version() -> None:
     assert env["python_full_version"] == expected_full
 
 
+def test_detect_environment_cached_returns_copy() -> None:
+    env = detect_environment()
+    env["os"] = "mutated"
+    assert detect_environment()["os"] != "mutated"
+
+
 def test_format_environment_context() -> None:
     env = {
         "python_version": "3.13",
@@ -55,6 +62,11 @@ def test_pyproject_template_substitution() -> None:
     assert "{python_version}" not in filled
 
 
+def test_render_pyproject_matches_replace() -> None:
+    expected = PYPROJECT_TEMPLATE.replace("{python_version}", "3.12")
+    assert render_pyproject("3.12") == expected
+
+
 def test_pyproject_template_has_pep621_structure() -> None:
     assert "[build-system]" in PYPROJECT_TEMPLATE
     assert "[project]" in PYPROJECT_TEMPLATE
@@ -1,12 +1,13 @@
 """Tests for GitIntegration with mocked subprocess calls."""
 
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from sago.utils.git_integration import _GIT_TIMEOUT, GitIntegration
+from sago.utils.git_integration import _GIT_TIMEOUT, GitIntegration, _run_with_pidfd
 
 
 @pytest.fixture
@@ -27,6 +28,24 @@ class TestIsGitRepo:
     def test_false_when_no_git_dir(self, git_no_repo: GitIntegration) -> None:
         assert git_no_repo.is_git_repo() is False
 
+    def test_is_git_repo_cached(self, git: GitIntegration, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = 0
+        original_exists = Path.exists
+
+        def counting_exists(self: Path, *args: object, **kwargs: object) -> bool:
+            nonlocal calls
+            calls += 1
+            return original_exists(self)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        assert all(git.is_git_repo() for _ in range(10))
+        assert calls == 1
+
+    def test_negative_result_not_cached(self, git_no_repo: GitIntegration) -> None:
+        assert git_no_repo.is_git_repo() is False
+        (git_no_repo.project_path / ".git").mkdir()
+        assert git_no_repo.is_git_repo() is True
+
 
 class TestInitRepo:
     def test_already_exists(self, git: GitIntegration) -> None:
@@ -39,6 +58,7 @@ class TestInitRepo:
         mock_run.assert_called_once()
         call_kwargs = mock_run.call_args
         assert call_kwargs.kwargs["timeout"] == _GIT_TIMEOUT
+        assert git_no_repo.is_git_repo() is True
 
     @patch("sago.utils.git_integration.subprocess.run")
     def test_failure(self, mock_run: MagicMock, git_no_repo: GitIntegration) -> None:
@@ -60,17 +80,33 @@ class TestCreateCommit:
         mock_run.return_value = MagicMock(stdout="M f.py", returncode=0)
         assert git.create_commit("1.1", "test task", ["f.py"]) is True
 
+    @patch("sago.utils.git_integration.subprocess.run")
+    def test_single_add_for_all_files(self, mock_run: MagicMock, git: GitIntegration) -> None:
+        mock_run.return_value = MagicMock(stdout="", returncode=0)
+        assert git.create_commit("1.1", "test", ["a.py", "b.py", "c.py"]) is True
+        cmds = [c.args[0] for c in mock_run.call_args_list]
+        assert cmds[0] == ["git", "add", "--", "a.py", "b.py", "c.py"]
+        assert cmds[1][:2] == ["git", "commit"]
+        assert len(cmds) == 2
+
     @patch("sago.utils.git_integration.subprocess.run")
     def test_no_changes(self, mock_run: MagicMock, git: GitIntegration) -> None:
-        # git add succeeds, git status returns empty (no changes)
+        # git add succeeds, git commit fails, git diff --cached --quiet says the index is empty
         def side_effect(*args: object, **kwargs: object) -> MagicMock:
             cmd = args[0]
-            if cmd[1] == "status":
-                return MagicMock(stdout="", returncode=0)
+            if cmd[1] == "commit":
+                return MagicMock(stdout="", returncode=1)
             return MagicMock(returncode=0)
 
         mock_run.side_effect = side_effect
         assert git.create_commit("1.1", "test", ["f.py"]) is True
+        cmds = [c.args[0] for c in mock_run.call_args_list]
+        assert cmds[-1] == ["git", "diff", "--cached", "--quiet"]
+
+    @patch("sago.utils.git_integration.subprocess.run")
+    def test_commit_error(self, mock_run: MagicMock, git: GitIntegration) -> None:
+        mock_run.return_value = MagicMock(stdout="", stderr="hook failed", returncode=1)
+        assert git.create_commit("1.1", "test", ["f.py"]) is False
 
     @patch("sago.utils.git_integration.subprocess.run")
     def test_failure(self, mock_run: MagicMock, git: GitIntegration) -> None:
@@ -111,22 +147,49 @@ class TestGetCurrentBranch:
 
 
 class TestPushBranch:
-    @patch("sago.utils.git_integration.subprocess.run")
+    @patch("sago.utils.git_integration._run_with_pidfd")
     def test_success(self, mock_run: MagicMock, git: GitIntegration) -> None:
         mock_run.return_value = MagicMock(returncode=0, stdout="main\n")
         assert git.push_branch("main") is True
+        assert mock_run.call_args[0][0] == ["git", "push", "-u", "origin", "main"]
+        assert mock_run.call_args.kwargs["timeout"] == _GIT_TIMEOUT
 
-    @patch("sago.utils.git_integration.subprocess.run")
+    @patch("sago.utils.git_integration._run_with_pidfd")
     def test_failure(self, mock_run: MagicMock, git: GitIntegration) -> None:
         mock_run.side_effect = subprocess.CalledProcessError(1, "git", stderr="denied")
         assert git.push_branch("main") is False
 
+    @patch("sago.utils.git_integration._run_with_pidfd")
+    def test_timeout(self, mock_run: MagicMock, git: GitIntegration) -> None:
+        mock_run.side_effect = subprocess.TimeoutExpired("git", _GIT_TIMEOUT)
+        assert git.push_branch("main") is False
+
     @patch("sago.utils.git_integration.subprocess.run")
     def test_no_branch_name(self, mock_run: MagicMock, git: GitIntegration) -> None:
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
         assert git.push_branch() is False
 
 
+class TestRunWithPidfd:
+    def test_captures_output(self, tmp_path: Path) -> None:
+        cmd = [sys.executable, "-c", "import sys; print('out'); print('err', file=sys.stderr)"]
+        result = _run_with_pidfd(cmd, cwd=tmp_path, timeout=10)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "out"
+        assert result.stderr.strip() == "err"
+
+    def test_nonzero_exit_raises(self, tmp_path: Path) -> None:
+        cmd = [sys.executable, "-c", "import sys; sys.exit(3)"]
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            _run_with_pidfd(cmd, cwd=tmp_path, timeout=10)
+        assert exc_info.value.returncode == 3
+
+    def test_timeout_kills_child(self, tmp_path: Path) -> None:
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_with_pidfd(cmd, cwd=tmp_path, timeout=0.2)
+
+
 class TestCheckpoint:
     @patch("sago.utils.git_integration.subprocess.run")
     def test_create_checkpoint(self, mock_run: MagicMock, git: GitIntegration) -> None:
@@ -1,11 +1,12 @@
 """Integration tests: end-to-end workflow through the CLI with mocked LLM."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
-from sago.cli import app
+from sago.cli import _compute_status, _do_plan, _do_replan, _do_status, app
 from tests.conftest import SAMPLE_PLAN
 
 runner = CliRunner()
@@ -54,7 +55,7 @@ def test_init_creates_project(tmp_path: Path) -> None:
     assert (project_path / ".planning").is_dir()
 
 
-def test_plan_generates_plan(sago_project: Path) -> None:
+def test_plan_generates_plan(sago_project: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """sago plan should call the orchestrator and write PLAN.md."""
     from sago.agents.base import AgentResult, AgentStatus
 
@@ -64,23 +65,18 @@ def test_plan_generates_plan(sago_project: Path) -> None:
         metadata={"plan_path": str(sago_project / "PLAN.md")},
     )
 
-    def fake_planner_execute(_context: dict) -> AgentResult:
+    async def fake_planner_execute(_self: object, _context: dict) -> AgentResult:
         (sago_project / "PLAN.md").write_text(SAMPLE_PLAN)
         return mock_result
 
     with (
         patch("sago.cli._check_llm_configured"),
         patch("sago.cli._check_placeholder_content"),
-        patch(
-            "sago.agents.planner.PlannerAgent.execute",
-            new_callable=AsyncMock,
-            side_effect=fake_planner_execute,
-        ),
+        patch("sago.agents.planner.PlannerAgent.execute", fake_planner_execute),
     ):
-        result = runner.invoke(app, ["plan", "--path", str(sago_project), "--force"])
+        _do_plan(sago_project, force=True, auto_accept=True)
 
-    assert result.exit_code == 0
-    assert "Plan generated successfully" in result.output
+    assert "Plan generated successfully" in capsys.readouterr().out
     assert (sago_project / "PLAN.md").exists()
 
 
@@ -94,13 +90,21 @@ def test_status_after_plan(sago_project_with_plan: Path) -> None:
 
 def test_status_shows_completed_tasks(sago_project_with_plan: Path) -> None:
     """Status should reflect tasks marked complete in STATE.md."""
-    result = runner.invoke(app, ["status", "--path", str(sago_project_with_plan), "--detailed"])
-    assert result.exit_code == 0
-    assert "1" in result.output  # at least 1 completed
-    assert "Create config" in result.output
+    report = _compute_status(sago_project_with_plan)
+    assert report.completed == 1
+    assert "Create config" in [t.name for t in report.tasks]
+
+
+def test_compute_status_marks_non_project(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """_compute_status should flag a non-project without printing or exiting."""
+    report = _compute_status(tmp_path)
+    assert not report.is_project
+    assert capsys.readouterr().out == ""
 
 
-def test_replan_one_shot(sago_project_with_plan: Path) -> None:
+def test_replan_one_shot(sago_project_with_plan: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """sago replan -f '...' -y should run non-interactively."""
     from sago.agents.base import AgentResult, AgentStatus
 
@@ -110,56 +114,36 @@ def test_replan_one_shot(sago_project_with_plan: Path) -> None:
         metadata={"plan_path": str(sago_project_with_plan / "PLAN.md")},
     )
 
-    def fake_replan_execute(_context: dict) -> AgentResult:
+    async def fake_replan_execute(_self: object, _context: dict) -> AgentResult:
         # Write the updated plan
         updated_plan = f"# Updated Plan\n\n```xml\n{UPDATED_XML}\n```\n"
         (sago_project_with_plan / "PLAN.md").write_text(updated_plan)
         return mock_result
 
-    mock_review_result = AgentResult(
-        status=AgentStatus.SUCCESS,
-        output="Looks good",
-        metadata={"phase_name": "Phase 1: Foundation"},
-    )
+    async def fake_review_execute(_self: object, _context: dict) -> AgentResult:
+        return AgentResult(
+            status=AgentStatus.SUCCESS,
+            output="Looks good",
+            metadata={"phase_name": "Phase 1: Foundation"},
+        )
 
     with (
         patch("sago.cli._check_llm_configured"),
-        patch(
-            "sago.agents.replanner.ReplannerAgent.execute",
-            new_callable=AsyncMock,
-            side_effect=fake_replan_execute,
-        ),
-        patch(
-            "sago.agents.reviewer.ReviewerAgent.execute",
-            new_callable=AsyncMock,
-            return_value=mock_review_result,
-        ),
+        patch("sago.agents.replanner.ReplannerAgent.execute", fake_replan_execute),
+        patch("sago.agents.reviewer.ReviewerAgent.execute", fake_review_execute),
     ):
-        result = runner.invoke(
-            app,
-            [
-                "replan",
-                "--path",
-                str(sago_project_with_plan),
-                "--feedback",
-                "add logging",
-                "--yes",
-            ],
-        )
+        _do_replan(sago_project_with_plan, feedback="add logging", auto_apply=True)
 
-    assert result.exit_code == 0
-    assert "Plan updated successfully" in result.output
+    assert "Plan updated successfully" in capsys.readouterr().out
 
 
-def test_full_workflow_init_plan_status(tmp_path: Path) -> None:
-    """Full workflow: init -> plan -> status."""
+def test_full_workflow_init_plan_status(
+    initialized_project: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Full workflow: init -> plan -> status (init comes from the session template)."""
     from sago.agents.base import AgentResult, AgentStatus
 
-    project_path = tmp_path / "full-test"
-
-    # Step 1: init
-    result = runner.invoke(app, ["init", "full-test", "--path", str(project_path), "--yes"])
-    assert result.exit_code == 0
+    project_path = initialized_project
 
     # Write real project content (not placeholders)
     (project_path / "PROJECT.md").write_text(
@@ -171,30 +155,24 @@ def test_full_workflow_init_plan_status(tmp_path: Path) -> None:
         "# Requirements\n\n## V1 Requirements (MVP)\n\n* [ ] **REQ-1:** Build the thing\n"
     )
 
-    # Step 2: plan
+    # Step 1: plan
     mock_result = AgentResult(
         status=AgentStatus.SUCCESS,
         output="Plan generated",
         metadata={"plan_path": str(project_path / "PLAN.md")},
     )
 
-    def fake_planner(_context: dict) -> AgentResult:
+    async def fake_planner(_self: object, _context: dict) -> AgentResult:
         (project_path / "PLAN.md").write_text(SAMPLE_PLAN)
         return mock_result
 
     with (
         patch("sago.cli._check_llm_configured"),
         patch("sago.cli._check_placeholder_content"),
-        patch(
-            "sago.agents.planner.PlannerAgent.execute",
-            new_callable=AsyncMock,
-            side_effect=fake_planner,
-        ),
+        patch("sago.agents.planner.PlannerAgent.execute", fake_planner),
     ):
-        result = runner.invoke(app, ["plan", "--path", str(project_path), "--force"])
-    assert result.exit_code == 0
+        _do_plan(project_path, force=True, auto_accept=True)
 
-    # Step 3: status
-    result = runner.invoke(app, ["status", "--path", str(project_path)])
-    assert result.exit_code == 0
-    assert "Project Status" in result.output
+    # Step 2: status
+    _do_status(project_path, detailed=False)
+    assert "Project Status" in capsys.readouterr().out
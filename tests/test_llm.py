@@ -1,3 +1,4 @@
+from types import SimpleNamespace as NS
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -5,7 +6,19 @@ import pytest
 from sago.utils.llm import LLMClient, LLMError
 
 
-@pytest.fixture
+def _chunk(content: str | None, finish: str | None = None) -> NS:
+    return NS(choices=[NS(delta=NS(content=content), finish_reason=finish)], model="gpt-4")
+
+
+def _response(content: str) -> NS:
+    return NS(
+        choices=[NS(message=NS(content=content), finish_reason="stop")],
+        model="gpt-4",
+        usage=NS(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+    )
+
+
+@pytest.fixture(scope="module")
 def llm_client() -> LLMClient:
     return LLMClient(model="gpt-4", api_key="test-key")
 
@@ -26,16 +39,7 @@ def test_llm_client_initialization() -> None:
 
 @patch("litellm.completion")
 def test_llm_client_calls_api(mock_completion: MagicMock, llm_client: LLMClient) -> None:
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "Test response"
-    mock_response.choices[0].finish_reason = "stop"
-    mock_response.model = "gpt-4"
-    mock_response.usage.prompt_tokens = 10
-    mock_response.usage.completion_tokens = 20
-    mock_response.usage.total_tokens = 30
-
-    mock_completion.return_value = mock_response
+    mock_completion.return_value = _response("Test response")
 
     messages = [{"role": "user", "content": "Hello"}]
     result = llm_client.chat_completion(messages)
@@ -97,16 +101,7 @@ def test_llm_client_handles_errors(mock_completion: MagicMock, llm_client: LLMCl
 @patch("litellm.completion")
 def test_llm_client_custom_temperature(mock_completion: MagicMock, llm_client: LLMClient) -> None:
     """Test using custom temperature."""
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "Response"
-    mock_response.choices[0].finish_reason = "stop"
-    mock_response.model = "gpt-4"
-    mock_response.usage.prompt_tokens = 10
-    mock_response.usage.completion_tokens = 20
-    mock_response.usage.total_tokens = 30
-
-    mock_completion.return_value = mock_response
+    mock_completion.return_value = _response("Response")
 
     messages = [{"role": "user", "content": "Hello"}]
     llm_client.chat_completion(messages, temperature=0.8)
@@ -118,19 +113,7 @@ def test_llm_client_custom_temperature(mock_completion: MagicMock, llm_client: L
 @patch("litellm.completion")
 def test_llm_client_streaming(mock_completion: MagicMock, llm_client: LLMClient) -> None:
     """Test streaming completion."""
-    chunk1 = MagicMock()
-    chunk1.choices = [MagicMock()]
-    chunk1.choices[0].delta.content = "Hello "
-    chunk1.choices[0].finish_reason = None
-    chunk1.model = "gpt-4"
-
-    chunk2 = MagicMock()
-    chunk2.choices = [MagicMock()]
-    chunk2.choices[0].delta.content = "world"
-    chunk2.choices[0].finish_reason = "stop"
-    chunk2.model = "gpt-4"
-
-    mock_completion.return_value = [chunk1, chunk2]
+    mock_completion.return_value = [_chunk("Hello "), _chunk("world", finish="stop")]
 
     messages = [{"role": "user", "content": "Hello"}]
     chunks_received = []
@@ -59,6 +59,13 @@ class TestTask:
         assert d["depends_on"] == ["1.0"]
         assert d["phase_name"] == "Phase 1"
 
+    def test_frozen(self) -> None:
+        from pydantic import ValidationError
+
+        task = Task(id="1.1", name="Setup", files=[], action="a", verify="v", done="d")
+        with pytest.raises(ValidationError):
+            task.name = "Other"  # type: ignore[misc]
+
 
 class TestPhase:
     def test_create(self) -> None:
@@ -278,38 +285,56 @@ class TestRoadmap:
 
 
 class TestClassifyFailure:
-    def test_syntax_error(self) -> None:
-        assert classify_failure("SyntaxError: invalid syntax", 1) == FailureCategory.SYNTAX_ERROR
-
-    def test_indentation_error(self) -> None:
-        assert (
-            classify_failure("IndentationError: unexpected indent", 1)
-            == FailureCategory.SYNTAX_ERROR
-        )
-
-    def test_import_error(self) -> None:
-        assert (
-            classify_failure("ModuleNotFoundError: No module named 'kafka'", 1)
-            == FailureCategory.IMPORT_ERROR
-        )
-
-    def test_import_error_generic(self) -> None:
-        assert (
-            classify_failure("ImportError: cannot import name 'foo'", 1)
-            == FailureCategory.IMPORT_ERROR
-        )
-
-    def test_assertion_failure(self) -> None:
-        assert (
-            classify_failure("AssertionError: expected True", 1)
-            == FailureCategory.ASSERTION_FAILURE
-        )
-
-    def test_assertion_pytest(self) -> None:
-        assert (
-            classify_failure("FAILED tests/test_foo.py::test_bar - assert 1 == 2", 1)
-            == FailureCategory.ASSERTION_FAILURE
-        )
+    @pytest.mark.parametrize(
+        ("stderr", "expected"),
+        [
+            pytest.param(
+                "SyntaxError: invalid syntax", FailureCategory.SYNTAX_ERROR, id="syntax_error"
+            ),
+            pytest.param(
+                "IndentationError: unexpected indent",
+                FailureCategory.SYNTAX_ERROR,
+                id="indentation_error",
+            ),
+            pytest.param(
+                "ModuleNotFoundError: No module named 'kafka'",
+                FailureCategory.IMPORT_ERROR,
+                id="import_error",
+            ),
+            pytest.param(
+                "ImportError: cannot import name 'foo'",
+                FailureCategory.IMPORT_ERROR,
+                id="import_error_generic",
+            ),
+            pytest.param(
+                "AssertionError: expected True",
+                FailureCategory.ASSERTION_FAILURE,
+                id="assertion_failure",
+            ),
+            pytest.param(
+                "FAILED tests/test_foo.py::test_bar - assert 1 == 2",
+                FailureCategory.ASSERTION_FAILURE,
+                id="assertion_pytest",
+            ),
+            pytest.param(
+                "TimeoutError: operation timed out", FailureCategory.TIMEOUT, id="timeout"
+            ),
+            pytest.param(
+                "Process timed out after 30s", FailureCategory.TIMEOUT, id="timeout_timed_out"
+            ),
+            pytest.param(
+                "TypeError: unsupported operand", FailureCategory.RUNTIME_ERROR, id="runtime_error"
+            ),
+            pytest.param(
+                "Traceback (most recent call last):\n  File 'x.py'\nKeyError: 'foo'",
+                FailureCategory.RUNTIME_ERROR,
+                id="traceback",
+            ),
+            pytest.param("something weird happened", FailureCategory.UNKNOWN, id="unknown"),
+        ],
+    )
+    def test_classifies(self, stderr: str, expected: FailureCategory) -> None:
+        assert classify_failure(stderr, 1) == expected
 
     def test_environment_missing(self) -> None:
         assert (
@@ -317,24 +342,6 @@ class TestClassifyFailure:
             == FailureCategory.ENVIRONMENT_MISSING
         )
 
-    def test_timeout(self) -> None:
-        assert classify_failure("TimeoutError: operation timed out", 1) == FailureCategory.TIMEOUT
-
-    def test_timeout_timed_out(self) -> None:
-        assert classify_failure("Process timed out after 30s", 1) == FailureCategory.TIMEOUT
-
-    def test_runtime_error(self) -> None:
-        assert (
-            classify_failure("TypeError: unsupported operand", 1) == FailureCategory.RUNTIME_ERROR
-        )
-
-    def test_traceback(self) -> None:
-        stderr = "Traceback (most recent call last):\n  File 'x.py'\nKeyError: 'foo'"
-        assert classify_failure(stderr, 1) == FailureCategory.RUNTIME_ERROR
-
-    def test_unknown(self) -> None:
-        assert classify_failure("something weird happened", 1) == FailureCategory.UNKNOWN
-
     def test_exit_code_zero(self) -> None:
         assert classify_failure("SyntaxError: blah", 0) == FailureCategory.UNKNOWN
 
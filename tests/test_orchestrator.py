@@ -1,5 +1,6 @@
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -7,15 +8,13 @@ from sago.agents.base import AgentResult, AgentStatus
 from sago.agents.orchestrator import Orchestrator, WorkflowResult
 from sago.core.config import Config
 
+# Results are never mutated by the orchestrator, so tests can share them.
+_PLAN_OK = AgentResult(status=AgentStatus.SUCCESS, output="Plan generated", metadata={})
+_PLAN_FAILED = AgentResult(
+    status=AgentStatus.FAILURE, output="", metadata={}, error="LLM call failed"
+)
 
-@pytest.fixture
-def mock_config(tmp_path: Path) -> Config:
-    return Config()
-
-
-@pytest.fixture
-def sample_plan_content() -> str:
-    return """# PLAN.md
+_SAMPLE_PLAN = b"""# PLAN.md
 
 ```xml
 <phases>
@@ -43,14 +42,40 @@ def sample_plan_content() -> str:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_config() -> Config:
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def plan_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project dir with PLAN.md written once; only for tests that don't modify it."""
+    path = tmp_path_factory.mktemp("plan")
+    (path / "PLAN.md").write_bytes(_SAMPLE_PLAN)
+    return path
+
+
+@pytest.fixture(scope="session")
 def orchestrator(mock_config: Config) -> Orchestrator:
+    """Shared across tests; agents are only ever patched for the duration of a test."""
     return Orchestrator(config=mock_config)
 
 
+@pytest.fixture
+def agent_mocks(orchestrator: Orchestrator, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Swap the agents' execute methods for AsyncMocks for the duration of one test."""
+    mocks = SimpleNamespace(planner=AsyncMock(), replanner=AsyncMock(), reviewer=AsyncMock())
+    monkeypatch.setattr(orchestrator.planner, "execute", mocks.planner)
+    monkeypatch.setattr(orchestrator.replanner, "execute", mocks.replanner)
+    monkeypatch.setattr(orchestrator.reviewer, "execute", mocks.reviewer)
+    return mocks
+
+
 def test_orchestrator_initialization(orchestrator: Orchestrator):
     assert orchestrator is not None
     assert orchestrator.planner is not None
+    assert orchestrator.replanner is not None
+    assert orchestrator.reviewer is not None
     assert orchestrator.parser is not None
     assert orchestrator.project_manager is not None
 
@@ -89,41 +114,31 @@ async def test_run_workflow_no_plan(orchestrator: Orchestrator, tmp_path: Path):
 
 @pytest.mark.asyncio
 async def test_run_workflow_with_plan_generation(
-    orchestrator: Orchestrator, tmp_path: Path, sample_plan_content: str
+    orchestrator: Orchestrator,
+    agent_mocks: SimpleNamespace,
+    tmp_path: Path,
 ):
-    mock_result = AgentResult(
-        status=AgentStatus.SUCCESS,
-        output="Plan generated",
-        metadata={"plan_path": str(tmp_path / "PLAN.md")},
-    )
+    def create_plan(*args, **kwargs):
+        (tmp_path / "PLAN.md").write_bytes(_SAMPLE_PLAN)
+        return _PLAN_OK
 
-    with patch.object(orchestrator.planner, "execute", new_callable=AsyncMock) as mock_planner:
+    agent_mocks.planner.side_effect = create_plan
 
-        def create_plan(*args, **kwargs):
-            (tmp_path / "PLAN.md").write_text(sample_plan_content)
-            return mock_result
-
-        mock_planner.side_effect = create_plan
-
-        result = await orchestrator.run_workflow(
-            project_path=tmp_path,
-            plan=True,
-        )
+    result = await orchestrator.run_workflow(
+        project_path=tmp_path,
+        plan=True,
+    )
 
-        assert result.success
-        assert result.total_tasks == 2
-        assert mock_planner.called
+    assert result.success
+    assert result.total_tasks == 2
+    assert agent_mocks.planner.called
 
 
 @pytest.mark.asyncio
-async def test_run_workflow_plan_exists(
-    orchestrator: Orchestrator, tmp_path: Path, sample_plan_content: str
-):
+async def test_run_workflow_plan_exists(orchestrator: Orchestrator, plan_dir: Path):
     """Test workflow succeeds when PLAN.md already exists and plan=False."""
-    (tmp_path / "PLAN.md").write_text(sample_plan_content)
-
     result = await orchestrator.run_workflow(
-        project_path=tmp_path,
+        project_path=plan_dir,
         plan=False,
     )
 
@@ -132,45 +147,35 @@ async def test_run_workflow_plan_exists(
 
 
 @pytest.mark.asyncio
-async def test_run_workflow_plan_generation_failure(orchestrator: Orchestrator, tmp_path: Path):
+async def test_run_workflow_plan_generation_failure(
+    orchestrator: Orchestrator, agent_mocks: SimpleNamespace, tmp_path: Path
+):
     """Test workflow fails when plan generation fails."""
-    mock_result = AgentResult(
-        status=AgentStatus.FAILURE,
-        output="",
-        metadata={},
-        error="LLM call failed",
-    )
-
-    with patch.object(orchestrator.planner, "execute", new_callable=AsyncMock) as mock_planner:
-        mock_planner.return_value = mock_result
-
-        result = await orchestrator.run_workflow(
-            project_path=tmp_path,
-            plan=True,
-        )
-
-        assert not result.success
-        assert "Plan generation failed" in result.error
-
-
-@pytest.mark.asyncio
-async def test_run_workflow_template_plan_rejected(orchestrator: Orchestrator, tmp_path: Path):
-    """Test that template PLAN.md is rejected when plan=False."""
-    (tmp_path / "PLAN.md").write_text("# PLAN.md\n\nRun `sago plan` to generate this file\n")
+    agent_mocks.planner.return_value = _PLAN_FAILED
 
     result = await orchestrator.run_workflow(
         project_path=tmp_path,
-        plan=False,
+        plan=True,
     )
 
     assert not result.success
-    assert "template" in result.error
+    assert "Plan generation failed" in result.error
 
 
 @pytest.mark.asyncio
-async def test_run_workflow_empty_plan(orchestrator: Orchestrator, tmp_path: Path):
-    """Test workflow fails when PLAN.md has no tasks."""
-    (tmp_path / "PLAN.md").write_text("# PLAN.md\n\nNo tasks here.\n")
+@pytest.mark.parametrize(
+    ("plan_text", "expected_error"),
+    [
+        ("# PLAN.md\n\nRun `sago plan` to generate this file\n", "template"),
+        ("# PLAN.md\n\nNo tasks here.\n", "No XML task block"),
+    ],
+    ids=["template", "empty"],
+)
+async def test_run_workflow_rejects_unusable_plan(
+    orchestrator: Orchestrator, tmp_path: Path, plan_text: str, expected_error: str
+):
+    """Test that a template or task-less PLAN.md fails the workflow when plan=False."""
+    (tmp_path / "PLAN.md").write_text(plan_text)
 
     result = await orchestrator.run_workflow(
         project_path=tmp_path,
@@ -178,18 +183,14 @@ async def test_run_workflow_empty_plan(orchestrator: Orchestrator, tmp_path: Pat
     )
 
     assert not result.success
-    assert result.error is not None
+    assert expected_error in result.error
 
 
 @pytest.mark.asyncio
-async def test_run_workflow_ignores_extra_kwargs(
-    orchestrator: Orchestrator, tmp_path: Path, sample_plan_content: str
-):
+async def test_run_workflow_ignores_extra_kwargs(orchestrator: Orchestrator, plan_dir: Path):
     """Test that extra kwargs (from old API) are silently ignored."""
-    (tmp_path / "PLAN.md").write_text(sample_plan_content)
-
     result = await orchestrator.run_workflow(
-        project_path=tmp_path,
+        project_path=plan_dir,
         plan=False,
         execute=True,
         verify=True,
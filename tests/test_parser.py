@@ -91,6 +91,44 @@ def test_parse_xml_tasks_invalid_xml(parser: MarkdownParser) -> None:
         parser.parse_xml_tasks(content)
 
 
+def test_parse_xml_tasks_stdlib_fallback(
+    parser: MarkdownParser, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without lxml the stdlib parser produces the same result and error contract."""
+    monkeypatch.setattr("sago.core.parser._LXML_PARSER", None)
+    content = (
+        '```xml\n<phases><phase name="P1"><!-- note -->'
+        '<task id="1.1"><name>T</name></task></phase></phases>\n```'
+    )
+
+    phases = parser.parse_xml_tasks(content)
+    assert [t.id for t in phases[0].tasks] == ["1.1"]
+    with pytest.raises(ValueError, match="Invalid XML"):
+        parser.parse_xml_tasks("```xml\n<phases><phase>\n```")
+
+
+@pytest.mark.parametrize("use_stdlib", [False, True], ids=["default", "stdlib"])
+def test_parse_xml_tasks_streams_top_level_phases(
+    parser: MarkdownParser, monkeypatch: pytest.MonkeyPatch, use_stdlib: bool
+) -> None:
+    """Only direct <phase> children of the root are parsed, in document order."""
+    if use_stdlib:
+        monkeypatch.setattr("sago.core.parser._LXML_PARSER", None)
+    content = """```xml
+<phases>
+    <phase name="A"><task id="1.1"><name>One</name></task></phase>
+    <notes><phase name="Nested"><task id="9.9"><name>Ignored</name></task></phase></notes>
+    <phase name="B"><description>Second</description><task id="2.1"><name>Two</name></task></phase>
+</phases>
+```"""
+
+    phases = parser.parse_xml_tasks(content)
+
+    assert [p.name for p in phases] == ["A", "B"]
+    assert phases[1].description == "Second"
+    assert [t.id for p in phases for t in p.tasks] == ["1.1", "2.1"]
+
+
 def test_parse_requirements(parser: MarkdownParser) -> None:
     """Test parsing requirements from REQUIREMENTS.md."""
     content = """
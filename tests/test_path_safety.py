@@ -1,5 +1,6 @@
 """Tests for path traversal protection."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -40,3 +41,50 @@ def test_safe_resolve_dot_current_dir(tmp_path: Path) -> None:
 def test_safe_resolve_empty_relative(tmp_path: Path) -> None:
     result = safe_resolve(tmp_path, "")
     assert result == tmp_path.resolve()
+
+
+def test_safe_resolve_blocks_symlink_escape(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "link").symlink_to(outside, target_is_directory=True)
+    with pytest.raises(ValueError, match="Path traversal blocked"):
+        safe_resolve(project, "link/secret.txt")
+
+
+def test_safe_resolve_rejects_without_filesystem_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_resolve(self: Path, strict: bool = False) -> Path:
+        raise AssertionError("resolve() called for a lexically rejected path")
+
+    monkeypatch.setattr(Path, "resolve", no_resolve)
+    with pytest.raises(ValueError, match="Path traversal blocked"):
+        safe_resolve(tmp_path, "src/../../outside.txt")
+
+
+def test_safe_resolve_blocks_unc_path(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Path traversal blocked"):
+        safe_resolve(tmp_path, "\\\\server\\share\\f.txt")
+
+
+@pytest.mark.parametrize("relative", ["C:\\Windows\\f.txt", "c:f.txt"])
+def test_safe_resolve_blocks_windows_drive_paths(
+    tmp_path: Path, relative: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Drive paths are rejected lexically, before anything touches the filesystem
+    monkeypatch.setattr(os, "name", "nt")
+    with pytest.raises(ValueError, match="Path traversal blocked"):
+        safe_resolve(tmp_path, relative)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="':' is not allowed in Windows file names")
+@pytest.mark.parametrize("relative", ["a:b", "c:notes.md"])
+def test_safe_resolve_allows_colon_names_on_posix(tmp_path: Path, relative: str) -> None:
+    assert safe_resolve(tmp_path, relative) == (tmp_path / relative).resolve()
+
+
+def test_safe_resolve_allows_dotdot_that_stays_inside(tmp_path: Path) -> None:
+    result = safe_resolve(tmp_path, "src/../docs/readme.md")
+    assert result == (tmp_path / "docs" / "readme.md").resolve()
@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
 
 import pytest
 
@@ -14,6 +15,24 @@ def project_manager(tmp_path: Path) -> ProjectManager:
     return ProjectManager(config)
 
 
+class _StubLLM:
+    """Minimal LLMClient stand-in: chat_completion returns the canned response."""
+
+    def __init__(self) -> None:
+        self.response: dict[str, Any] = {}
+
+    def chat_completion(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return self.response
+
+
+@pytest.fixture
+def mock_llm_client(monkeypatch: pytest.MonkeyPatch) -> _StubLLM:
+    """Stand-in returned for every LLMClient built during the test."""
+    client = _StubLLM()
+    monkeypatch.setattr("sago.utils.llm.LLMClient", lambda *args, **kwargs: client)
+    return client
+
+
 def test_init_creates_templates(tmp_path: Path, project_manager: ProjectManager) -> None:
     """Test that init creates exactly 4 template files."""
     project_path = tmp_path / "test_project"
@@ -23,42 +42,37 @@ def test_init_creates_templates(tmp_path: Path, project_manager: ProjectManager)
     assert project_path.exists()
     assert (project_path / ".planning").exists()
 
-    # Check all 4 template files are created
-    for template_file in ProjectManager.TEMPLATE_FILES:
-        file_path = project_path / template_file
-        assert file_path.exists(), f"{template_file} should exist"
-        assert file_path.stat().st_size > 0, f"{template_file} should not be empty"
+    # Check all template files are created and non-empty (one directory scan)
+    with os.scandir(project_path) as it:
+        sizes = {entry.name: entry.stat().st_size for entry in it if entry.is_file()}
+    template_files = ProjectManager.TEMPLATE_FILES
+    for template_file in template_files:
+        assert sizes.get(template_file, 0) > 0, f"{template_file} should exist and not be empty"
 
     # Check dropped files do NOT exist
     for dropped in ["ROADMAP.md", "SUMMARY.md"]:
-        assert not (project_path / dropped).exists(), f"{dropped} should not exist"
+        assert dropped not in sizes, f"{dropped} should not exist"
 
 
 def test_init_with_existing_project(tmp_path: Path, project_manager: ProjectManager) -> None:
     """Test that init raises error if project exists."""
-    project_path = tmp_path / "existing_project"
-    project_path.mkdir()
-    (project_path / "PROJECT.md").write_text("existing content")
+    (tmp_path / "PROJECT.md").write_text("existing content")
 
     with pytest.raises(FileExistsError):
-        project_manager.init_project(project_path)
+        project_manager.init_project(tmp_path)
 
 
 def test_init_with_overwrite(tmp_path: Path, project_manager: ProjectManager) -> None:
     """Test that init can overwrite existing files."""
-    project_path = tmp_path / "overwrite_project"
-    project_path.mkdir()
-    (project_path / "PROJECT.md").write_text("old content")
+    (tmp_path / "PROJECT.md").write_text("old content")
 
-    project_manager.init_project(project_path, overwrite=True)
+    project_manager.init_project(tmp_path, overwrite=True)
 
-    content = (project_path / "PROJECT.md").read_text()
-    assert "old content" not in content
+    assert b"old content" not in (tmp_path / "PROJECT.md").read_bytes()
 
 
-def test_read_write_file(tmp_path: Path, project_manager: ProjectManager) -> None:
-    project_path = tmp_path / "rw_project"
-    project_manager.init_project(project_path)
+def test_read_write_file(initialized_project: Path, project_manager: ProjectManager) -> None:
+    project_path = initialized_project
 
     new_content = "# New Content\nThis is a test."
     project_manager.write_file(project_path, "TEST.md", new_content)
@@ -67,40 +81,34 @@ def test_read_write_file(tmp_path: Path, project_manager: ProjectManager) -> Non
     assert content == new_content
 
 
-def test_update_file(tmp_path: Path, project_manager: ProjectManager) -> None:
-    project_path = tmp_path / "update_project"
-    project_manager.init_project(project_path)
+def test_update_file(initialized_project: Path, project_manager: ProjectManager) -> None:
+    project_path = initialized_project
 
     updates = {
         "Active Phase:** Not started": "Active Phase:** Phase 1",
     }
     project_manager.update_file(project_path, "STATE.md", updates)
 
-    content = project_manager.read_file(project_path, "STATE.md")
-    assert "Phase 1" in content
+    assert b"Active Phase:** Phase 1" in (project_path / "STATE.md").read_bytes()
 
 
-def test_get_project_info(tmp_path: Path, project_manager: ProjectManager) -> None:
+def test_get_project_info(initialized_project: Path, project_manager: ProjectManager) -> None:
     """Test getting project information."""
-    project_path = tmp_path / "info_project"
-    project_manager.init_project(project_path)
-
-    info = project_manager.get_project_info(project_path)
+    info = project_manager.get_project_info(initialized_project)
 
     assert info["exists"] is True
     assert info["has_planning_dir"] is True
-    assert info["name"] == "info_project"
+    assert info["name"] == initialized_project.name
     assert all(info["template_files"].values())
 
 
-def test_is_sago_project(tmp_path: Path, project_manager: ProjectManager) -> None:
-    non_project = tmp_path / "not_sago"
-    non_project.mkdir()
-    assert project_manager.is_sago_project(non_project) is False
+def test_is_sago_project(
+    tmp_path: Path, initialized_project: Path, project_manager: ProjectManager
+) -> None:
+    # tmp_path itself is an existing, empty directory
+    assert project_manager.is_sago_project(tmp_path) is False
 
-    sago_project = tmp_path / "sago_project"
-    project_manager.init_project(sago_project)
-    assert project_manager.is_sago_project(sago_project) is True
+    assert project_manager.is_sago_project(initialized_project) is True
 
 
 def test_template_variable_substitution(tmp_path: Path, project_manager: ProjectManager) -> None:
@@ -109,15 +117,16 @@ def test_template_variable_substitution(tmp_path: Path, project_manager: Project
 
     project_manager.init_project(project_path, template_vars=template_vars)
 
-    content = project_manager.read_file(project_path, "PROJECT.md")
-    assert "{{project_name}}" not in content
-    assert "MyAwesomeProject" in content
+    data = (project_path / "PROJECT.md").read_bytes()
+    assert b"{{project_name}}" not in data
+    assert b"MyAwesomeProject" in data
 
 
 @pytest.mark.asyncio
-async def test_generate_from_prompt(tmp_path: Path, project_manager: ProjectManager) -> None:
-    project_path = tmp_path / "prompt_project"
-    project_manager.init_project(project_path, project_name="todo-app")
+async def test_generate_from_prompt(
+    initialized_project: Path, project_manager: ProjectManager, mock_llm_client: _StubLLM
+) -> None:
+    project_path = initialized_project
 
     fake_response = {
         "content": (
@@ -134,27 +143,22 @@ async def test_generate_from_prompt(tmp_path: Path, project_manager: ProjectMana
         "model": "test",
     }
 
-    with patch("sago.utils.llm.LLMClient") as mock_cls:
-        mock_client = MagicMock()
-        mock_client.chat_completion.return_value = fake_response
-        mock_cls.return_value = mock_client
+    mock_llm_client.response = fake_response
 
-        await project_manager.generate_from_prompt("A todo app", project_path, "todo-app")
+    await project_manager.generate_from_prompt("A todo app", project_path, "todo-app")
 
-    project_md = (project_path / "PROJECT.md").read_text()
-    assert "todo-app" in project_md
-    assert "Project Vision" in project_md
+    project_md = (project_path / "PROJECT.md").read_bytes()
+    assert b"todo-app" in project_md
+    assert b"Project Vision" in project_md
 
-    req_md = (project_path / "REQUIREMENTS.md").read_text()
-    assert "REQ-1" in req_md
+    assert b"REQ-1" in (project_path / "REQUIREMENTS.md").read_bytes()
 
 
 @pytest.mark.asyncio
 async def test_generate_from_prompt_parse_error(
-    tmp_path: Path, project_manager: ProjectManager
+    initialized_project: Path, project_manager: ProjectManager, mock_llm_client: _StubLLM
 ) -> None:
-    project_path = tmp_path / "bad_prompt_project"
-    project_manager.init_project(project_path, project_name="bad-project")
+    project_path = initialized_project
 
     fake_response = {
         "content": "Here is your project plan without any file markers.",
@@ -163,10 +167,7 @@ async def test_generate_from_prompt_parse_error(
         "model": "test",
     }
 
-    with patch("sago.utils.llm.LLMClient") as mock_cls:
-        mock_client = MagicMock()
-        mock_client.chat_completion.return_value = fake_response
-        mock_cls.return_value = mock_client
+    mock_llm_client.response = fake_response
 
-        with pytest.raises(ValueError, match="missing expected files"):
-            await project_manager.generate_from_prompt("bad prompt", project_path, "bad-project")
+    with pytest.raises(ValueError, match="missing expected files"):
+        await project_manager.generate_from_prompt("bad prompt", project_path, "bad-project")
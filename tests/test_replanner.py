@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -7,6 +7,8 @@ from sago.agents.base import AgentResult, AgentStatus
 from sago.agents.orchestrator import Orchestrator
 from sago.agents.replanner import ReplannerAgent
 from sago.core.config import Config  # noqa: I001
+from sago.models import Phase, Task
+from sago.utils.repo_map import generate_repo_map
 
 SAMPLE_PLAN = """# PLAN.md
 
@@ -75,127 +77,159 @@ UPDATED_XML = """<phases>
     </phase>
 </phases>"""
 
-
-@pytest.fixture
+# Pre-encoded once so fixtures and tests can write files without re-encoding.
+_SAMPLE_PLAN_B = SAMPLE_PLAN.encode("utf-8")
+_SAMPLE_STATE_B = SAMPLE_STATE.encode("utf-8")
+_PROJECT_B = b"# My Project\nA test project."
+_REQUIREMENTS_B = b"# Requirements\n* [ ] **REQ-1:** Do stuff"
+_PROJECT_FILES = (
+    ("PLAN.md", _SAMPLE_PLAN_B),
+    ("STATE.md", _SAMPLE_STATE_B),
+    ("PROJECT.md", _PROJECT_B),
+    ("REQUIREMENTS.md", _REQUIREMENTS_B),
+)
+
+# Phase and Task are frozen models, so one instance can be shared by every test.
+_SAMPLE_PHASE = Phase(
+    name="Phase 1: Foundation",
+    description="Set up project",
+    tasks=[
+        Task(
+            id="1.1",
+            name="Create config",
+            files=["config.py"],
+            action="Create config",
+            verify="python -c 'import config'",
+            done="Config exists",
+            phase_name="Phase 1: Foundation",
+        ),
+    ],
+)
+
+
+def _msgs(mock_llm: AsyncMock) -> tuple[str, str]:
+    """(system, user) message contents from the last LLM call."""
+    system, user = mock_llm.call_args.args[0][:2]
+    return system["content"], user["content"]
+
+
+@pytest.fixture(scope="session")
 def mock_config() -> Config:
     return Config()
 
 
 @pytest.fixture
-def replanner(mock_config: Config) -> ReplannerAgent:
+def replanner(mock_config: Config, monkeypatch: pytest.MonkeyPatch) -> ReplannerAgent:
+    """Replanner with repo-map scanning stubbed out; only the repo-map test needs it."""
+    monkeypatch.setattr("sago.utils.repo_map.generate_repo_map", lambda _path: "")
     return ReplannerAgent(config=mock_config)
 
 
+@pytest.fixture
+def mock_llm(replanner: ReplannerAgent, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch the replanner's LLM call; it answers with UPDATED_XML unless a test overrides it."""
+    mock = AsyncMock(return_value={"content": UPDATED_XML})
+    monkeypatch.setattr(replanner, "_call_llm", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def orchestrator(mock_config: Config) -> Orchestrator:
+    """Shared across the module; agents are only monkeypatched for the duration of a test."""
+    return Orchestrator(config=mock_config)
+
+
 @pytest.fixture
 def project_with_plan(tmp_path: Path) -> Path:
-    """Create a project directory with PLAN.md and STATE.md."""
-    (tmp_path / "PLAN.md").write_text(SAMPLE_PLAN)
-    (tmp_path / "STATE.md").write_text(SAMPLE_STATE)
-    (tmp_path / "PROJECT.md").write_text("# My Project\nA test project.")
-    (tmp_path / "REQUIREMENTS.md").write_text("# Requirements\n* [ ] **REQ-1:** Do stuff")
+    """Project directory with PLAN.md and STATE.md."""
+    for name, data in _PROJECT_FILES:
+        (tmp_path / name).write_bytes(data)
     return tmp_path
 
 
 @pytest.mark.asyncio
 async def test_replan_prompt_includes_current_xml(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should include the current plan XML."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "<task id=" in user_msg
-        assert "Create config" in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "<task id=" in user_msg
+    assert "Create config" in user_msg
 
 
 @pytest.mark.asyncio
 async def test_replan_prompt_includes_state_summary(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should include task state summary."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "1 done" in user_msg
-        assert "DONE" in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "1 done" in user_msg
+    assert "DONE" in user_msg
 
 
 @pytest.mark.asyncio
 async def test_replan_system_prompt_preserves_done(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """System prompt should instruct preserving completed tasks."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        system_msg = call_args[0]["content"]
-        assert "DONE" in system_msg
-        assert "preserved" in system_msg.lower()
+    system_msg, _ = _msgs(mock_llm)
+    assert "DONE" in system_msg
+    assert "preserved" in system_msg.lower()
 
 
 @pytest.mark.asyncio
 async def test_replan_prompt_includes_feedback(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should include the user's feedback."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "add rate limiting" in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "add rate limiting" in user_msg
 
 
 @pytest.mark.asyncio
 async def test_replan_invalid_xml_raises(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Invalid XML from LLM should raise ValueError."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": "Here is the updated plan but no XML."}
-
-        result = await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    mock_llm.return_value = {"content": "Here is the updated plan but no XML."}
 
-        assert result.status == AgentStatus.FAILURE
-        assert result.error is not None
+    result = await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
+
+    assert result.status == AgentStatus.FAILURE
+    assert result.error is not None
 
 
 @pytest.mark.asyncio
@@ -214,32 +248,29 @@ async def test_replan_missing_plan_raises(replanner: ReplannerAgent, tmp_path: P
 
 @pytest.mark.asyncio
 async def test_replan_saves_updated_plan(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan should save the updated XML to PLAN.md."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        result = await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    result = await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        assert result.status == AgentStatus.SUCCESS
-        new_content = (project_with_plan / "PLAN.md").read_text()
-        assert "rate limiting" in new_content.lower()
-        assert "ReplannerAgent" in new_content
+    assert result.status == AgentStatus.SUCCESS
+    saved = (project_with_plan / "PLAN.md").read_bytes()
+    assert b"Create rate limiting middleware" in saved
+    assert b"ReplannerAgent" in saved
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_replan_workflow(tmp_path: Path) -> None:
+async def test_orchestrator_replan_workflow(
+    orchestrator: Orchestrator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test the orchestrator's run_replan_workflow method."""
-    (tmp_path / "PLAN.md").write_text(SAMPLE_PLAN)
-    (tmp_path / "STATE.md").write_text(SAMPLE_STATE)
-
-    orchestrator = Orchestrator(config=Config())
+    (tmp_path / "PLAN.md").write_bytes(_SAMPLE_PLAN_B)
+    (tmp_path / "STATE.md").write_bytes(_SAMPLE_STATE_B)
 
     mock_result = AgentResult(
         status=AgentStatus.SUCCESS,
@@ -247,31 +278,32 @@ async def test_orchestrator_replan_workflow(tmp_path: Path) -> None:
         metadata={"plan_path": str(tmp_path / "PLAN.md")},
     )
 
-    with patch.object(orchestrator.replanner, "execute", new_callable=AsyncMock) as mock_replan:
+    mock_replan = AsyncMock()
+    monkeypatch.setattr(orchestrator.replanner, "execute", mock_replan)
 
-        def do_replan(*args: object, **kwargs: object) -> AgentResult:
-            # Write updated PLAN.md (simulating what the agent does)
-            updated = SAMPLE_PLAN.replace("Create main", "Create main with CLI")
-            (tmp_path / "PLAN.md").write_text(updated)
-            return mock_result
+    def do_replan(*args: object, **kwargs: object) -> AgentResult:
+        # Write updated PLAN.md (simulating what the agent does)
+        updated = SAMPLE_PLAN.replace("Create main", "Create main with CLI")
+        (tmp_path / "PLAN.md").write_text(updated)
+        return mock_result
 
-        mock_replan.side_effect = do_replan
+    mock_replan.side_effect = do_replan
 
-        result = await orchestrator.run_replan_workflow(
-            project_path=tmp_path,
-            feedback="add CLI support",
-        )
+    result = await orchestrator.run_replan_workflow(
+        project_path=tmp_path,
+        feedback="add CLI support",
+    )
 
-        assert result.success
-        assert mock_replan.called
+    assert result.success
+    assert mock_replan.called
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_replan_failure(tmp_path: Path) -> None:
+async def test_orchestrator_replan_failure(
+    orchestrator: Orchestrator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test replan workflow handles agent failure."""
-    (tmp_path / "PLAN.md").write_text(SAMPLE_PLAN)
-
-    orchestrator = Orchestrator(config=Config())
+    (tmp_path / "PLAN.md").write_bytes(_SAMPLE_PLAN_B)
 
     mock_result = AgentResult(
         status=AgentStatus.FAILURE,
@@ -280,172 +312,142 @@ async def test_orchestrator_replan_failure(tmp_path: Path) -> None:
         error="LLM call failed",
     )
 
-    with patch.object(orchestrator.replanner, "execute", new_callable=AsyncMock) as mock_replan:
-        mock_replan.return_value = mock_result
+    mock_replan = AsyncMock(return_value=mock_result)
+    monkeypatch.setattr(orchestrator.replanner, "execute", mock_replan)
 
-        result = await orchestrator.run_replan_workflow(
-            project_path=tmp_path,
-            feedback="add CLI support",
-        )
+    result = await orchestrator.run_replan_workflow(
+        project_path=tmp_path,
+        feedback="add CLI support",
+    )
 
-        assert not result.success
-        assert "Replan failed" in (result.error or "")
+    assert not result.success
+    assert "Replan failed" in (result.error or "")
 
 
-def test_orchestrator_has_replanner() -> None:
+def test_orchestrator_has_replanner(orchestrator: Orchestrator) -> None:
     """Test that Orchestrator initializes a ReplannerAgent."""
-    orchestrator = Orchestrator(config=Config())
     assert hasattr(orchestrator, "replanner")
     assert isinstance(orchestrator.replanner, ReplannerAgent)
 
 
-def test_orchestrator_has_reviewer() -> None:
+def test_orchestrator_has_reviewer(orchestrator: Orchestrator) -> None:
     """Test that Orchestrator initializes a ReviewerAgent."""
     from sago.agents.reviewer import ReviewerAgent
 
-    orchestrator = Orchestrator(config=Config())
     assert hasattr(orchestrator, "reviewer")
     assert isinstance(orchestrator.reviewer, ReviewerAgent)
 
 
 @pytest.mark.asyncio
 async def test_replan_prompt_includes_review_context(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should include review context when provided."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "fix the issues",
-                "review_context": "[WARNING] config.py missing DB_URL validation",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "fix the issues",
+            "review_context": "[WARNING] config.py missing DB_URL validation",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "Phase Review Feedback" in user_msg
-        assert "config.py missing DB_URL validation" in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "Phase Review Feedback" in user_msg
+    assert "config.py missing DB_URL validation" in user_msg
 
 
 @pytest.mark.asyncio
 async def test_replan_prompt_without_review_context(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should not include review section when no review context."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "Phase Review Feedback" not in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "Phase Review Feedback" not in user_msg
 
 
 @pytest.mark.asyncio
-async def test_replan_loads_repo_map(replanner: ReplannerAgent, project_with_plan: Path) -> None:
+async def test_replan_loads_repo_map(
+    replanner: ReplannerAgent,
+    project_with_plan: Path,
+    mock_llm: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Replan should include repo map in project context."""
+    monkeypatch.setattr("sago.utils.repo_map.generate_repo_map", generate_repo_map)
     # Create a Python file so the repo map has something to find
     (project_with_plan / "config.py").write_text("class AppConfig:\n    pass\n")
 
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "add rate limiting",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "add rate limiting",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "REPO_MAP" in user_msg
-        assert "AppConfig" in user_msg
+    _, user_msg = _msgs(mock_llm)
+    assert "REPO_MAP" in user_msg
+    assert "AppConfig" in user_msg
 
 
 @pytest.mark.asyncio
 async def test_replan_corrective_task_rule_in_prompt(
-    replanner: ReplannerAgent, project_with_plan: Path
+    replanner: ReplannerAgent, project_with_plan: Path, mock_llm: AsyncMock
 ) -> None:
     """Replan prompt should include the corrective task rule (rule 9)."""
-    with patch.object(replanner, "_call_llm", new_callable=AsyncMock) as mock_llm:
-        mock_llm.return_value = {"content": UPDATED_XML}
-
-        await replanner.execute(
-            {
-                "project_path": project_with_plan,
-                "feedback": "fix issues",
-                "review_context": "some review feedback",
-            }
-        )
+    await replanner.execute(
+        {
+            "project_path": project_with_plan,
+            "feedback": "fix issues",
+            "review_context": "some review feedback",
+        }
+    )
 
-        call_args = mock_llm.call_args[0][0]
-        user_msg = call_args[1]["content"]
-        assert "corrective tasks" in user_msg.lower()
+    _, user_msg = _msgs(mock_llm)
+    assert "corrective tasks" in user_msg.lower()
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_run_review(tmp_path: Path) -> None:
+async def test_orchestrator_run_review(
+    orchestrator: Orchestrator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test the orchestrator's run_review method."""
-    from sago.models import Phase, Task
-
-    (tmp_path / "PROJECT.md").write_text("# Test\nA test project.")
-    (tmp_path / "REQUIREMENTS.md").write_text("# Requirements\n* [ ] **REQ-1:** Do stuff")
+    (tmp_path / "PROJECT.md").write_bytes(b"# Test\nA test project.")
+    (tmp_path / "REQUIREMENTS.md").write_bytes(_REQUIREMENTS_B)
     (tmp_path / "config.py").write_text("DB_URL = 'sqlite:///test.db'\n")
 
-    orchestrator = Orchestrator(config=Config())
-
-    phase = Phase(
-        name="Phase 1: Foundation",
-        description="Set up project",
-        tasks=[
-            Task(
-                id="1.1",
-                name="Create config",
-                files=["config.py"],
-                action="Create config",
-                verify="python -c 'import config'",
-                done="Config exists",
-                phase_name="Phase 1: Foundation",
-            ),
-        ],
-    )
-
     mock_review = AgentResult(
         status=AgentStatus.SUCCESS,
         output="[WARNING] config.py missing validation",
         metadata={"phase_name": "Phase 1: Foundation"},
     )
 
-    with patch.object(orchestrator.reviewer, "execute", new_callable=AsyncMock) as mock_exec:
-        mock_exec.return_value = mock_review
+    mock_exec = AsyncMock(return_value=mock_review)
+    monkeypatch.setattr(orchestrator.reviewer, "execute", mock_exec)
 
-        result = await orchestrator.run_review(tmp_path, phase, "Review for correctness")
+    result = await orchestrator.run_review(tmp_path, _SAMPLE_PHASE, "Review for correctness")
 
-        assert result.success
-        assert "missing validation" in result.output
-        mock_exec.assert_called_once()
-        ctx = mock_exec.call_args[0][0]
-        assert ctx["phase"] is phase
-        assert ctx["review_prompt"] == "Review for correctness"
+    assert result.success
+    assert "missing validation" in result.output
+    mock_exec.assert_called_once()
+    ctx = mock_exec.call_args[0][0]
+    assert ctx["phase"] is _SAMPLE_PHASE
+    assert ctx["review_prompt"] == "Review for correctness"
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_replan_passes_review_context(tmp_path: Path) -> None:
+async def test_orchestrator_replan_passes_review_context(
+    orchestrator: Orchestrator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that run_replan_workflow passes review_context to replanner."""
-    (tmp_path / "PLAN.md").write_text(SAMPLE_PLAN)
-    (tmp_path / "STATE.md").write_text(SAMPLE_STATE)
-
-    orchestrator = Orchestrator(config=Config())
+    (tmp_path / "PLAN.md").write_bytes(_SAMPLE_PLAN_B)
+    (tmp_path / "STATE.md").write_bytes(_SAMPLE_STATE_B)
 
     mock_result = AgentResult(
         status=AgentStatus.SUCCESS,
@@ -453,24 +455,25 @@ async def test_orchestrator_replan_passes_review_context(tmp_path: Path) -> None
         metadata={"plan_path": str(tmp_path / "PLAN.md")},
     )
 
-    with patch.object(orchestrator.replanner, "execute", new_callable=AsyncMock) as mock_replan:
+    mock_replan = AsyncMock()
+    monkeypatch.setattr(orchestrator.replanner, "execute", mock_replan)
 
-        def do_replan(_context: dict) -> AgentResult:
-            (tmp_path / "PLAN.md").write_text(
-                SAMPLE_PLAN.replace("Create main", "Create main with CLI")
-            )
-            return mock_result
+    def do_replan(_context: dict) -> AgentResult:
+        (tmp_path / "PLAN.md").write_text(
+            SAMPLE_PLAN.replace("Create main", "Create main with CLI")
+        )
+        return mock_result
 
-        mock_replan.side_effect = do_replan
+    mock_replan.side_effect = do_replan
 
-        result = await orchestrator.run_replan_workflow(
-            project_path=tmp_path,
-            feedback="fix issues",
-            review_context="[WARNING] missing validation",
-            repo_map="config.py:\n  class AppConfig\n",
-        )
+    result = await orchestrator.run_replan_workflow(
+        project_path=tmp_path,
+        feedback="fix issues",
+        review_context="[WARNING] missing validation",
+        repo_map="config.py:\n  class AppConfig\n",
+    )
 
-        assert result.success
-        ctx = mock_replan.call_args[0][0]
-        assert ctx["review_context"] == "[WARNING] missing validation"
-        assert ctx["repo_map"] == "config.py:\n  class AppConfig\n"
+    assert result.success
+    ctx = mock_replan.call_args[0][0]
+    assert ctx["review_context"] == "[WARNING] missing validation"
+    assert ctx["repo_map"] == "config.py:\n  class AppConfig\n"
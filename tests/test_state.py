@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from sago.models.plan import Phase, Task
 from sago.models.state import TaskStatus
 from sago.state import StateManager
@@ -477,6 +479,21 @@ def test_get_project_state_empty(tmp_path: Path) -> None:
     assert state.resume_point is None
 
 
+def test_get_project_state_reads_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Task states, context and resume point all come from a single read."""
+    content = INITIAL_STATE + "[✓] 1.1: Create config\n  [✗] 1.2: Create main — indented\n"
+    mgr = _make_manager(tmp_path, content)
+    reads: list[int] = []
+    original = mgr._read
+    monkeypatch.setattr(mgr, "_read", lambda: reads.append(1) or original())
+
+    state = mgr.get_project_state(_make_phases())
+
+    assert len(reads) == 1
+    status = {ts.task_id: ts.status for ts in state.task_states}
+    assert status == {"1.1": TaskStatus.DONE, "1.2": TaskStatus.FAILED, "2.1": TaskStatus.PENDING}
+
+
 # ------------------------------------------------------------------
 # Validation
 # ------------------------------------------------------------------
@@ -1,5 +1,7 @@
+import io
 import json
-import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -7,6 +9,18 @@ import pytest
 from sago.utils.tracer import Tracer
 
 
+def _read_jsonl(path: Path) -> list[bytes]:
+    """Trace lines as raw bytes; json.loads takes bytes, so there is no decode pass."""
+    return path.read_bytes().rstrip().splitlines()
+
+
+@pytest.fixture(scope="session")
+def thread_pool() -> Iterator[ThreadPoolExecutor]:
+    """Worker threads started once and reused by every concurrent tracer test."""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        yield pool
+
+
 @pytest.fixture()
 def tmp_trace(tmp_path: Path) -> Path:
     return tmp_path / "trace.jsonl"
@@ -36,13 +50,31 @@ def test_tracer_configure_and_emit(fresh_tracer: Tracer, tmp_trace: Path) -> Non
     assert event.agent == "PlannerAgent"
     assert event.data["path"] == "README.md"
 
-    lines = tmp_trace.read_text().strip().splitlines()
+    lines = _read_jsonl(tmp_trace)
     assert len(lines) == 1
     parsed = json.loads(lines[0])
     assert parsed["event_type"] == "file_read"
     assert parsed["trace_id"] == fresh_tracer.trace_id
 
 
+def test_tracer_buffered_writes(fresh_tracer: Tracer, tmp_trace: Path) -> None:
+    fresh_tracer.configure(tmp_trace, write_buffer_bytes=65536)
+
+    fresh_tracer.emit("first", "Agent")
+    fresh_tracer.emit("second", "Agent")
+    assert tmp_trace.read_bytes() == b""
+
+    fresh_tracer.flush()
+    assert [json.loads(line)["event_type"] for line in _read_jsonl(tmp_trace)] == [
+        "first",
+        "second",
+    ]
+
+    fresh_tracer.emit("third", "Agent")
+    fresh_tracer.close()
+    assert len(_read_jsonl(tmp_trace)) == 3
+
+
 def test_tracer_span_tracks_duration(fresh_tracer: Tracer, tmp_trace: Path) -> None:
     fresh_tracer.configure(tmp_trace)
 
@@ -51,7 +83,7 @@ def test_tracer_span_tracks_duration(fresh_tracer: Tracer, tmp_trace: Path) -> N
 
     fresh_tracer.close()
 
-    lines = tmp_trace.read_text().strip().splitlines()
+    lines = _read_jsonl(tmp_trace)
     assert len(lines) == 2  # start + end
 
     start = json.loads(lines[0])
@@ -74,7 +106,7 @@ def test_tracer_parent_span_nesting(fresh_tracer: Tracer, tmp_trace: Path) -> No
     assert inner_event is not None
     assert inner_event.parent_span_id == outer.span_id
 
-    lines = tmp_trace.read_text().strip().splitlines()
+    lines = _read_jsonl(tmp_trace)
     assert len(lines) == 3  # outer_start, inner_event, outer_end
 
 
@@ -91,34 +123,72 @@ def test_tracer_close_and_reset(fresh_tracer: Tracer, tmp_trace: Path) -> None:
     assert fresh_tracer.trace_id == ""
 
 
-def test_tracer_thread_safety(fresh_tracer: Tracer, tmp_trace: Path) -> None:
-    fresh_tracer.configure(tmp_trace)
-    n_threads = 10
-    n_events = 50
-    errors: list[Exception] = []
+def _emit_concurrently(
+    pool: ThreadPoolExecutor, tracer: Tracer, n_threads: int, n_events: int
+) -> None:
+    """Emit ``n_events`` events from each of ``n_threads`` workers; worker errors re-raise."""
+    payloads = [{"i": i} for i in range(n_events)]
 
     def emit_events() -> None:
-        try:
-            for i in range(n_events):
-                fresh_tracer.emit("test", "Thread", {"i": i})
-        except Exception as e:
-            errors.append(e)
-
-    threads = [threading.Thread(target=emit_events) for _ in range(n_threads)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+        for payload in payloads:
+            tracer.emit("test", "Thread", payload)
+
+    futures = [pool.submit(emit_events) for _ in range(n_threads)]
+    for future in futures:
+        future.result()
+
+
+def _assert_all_events_written(data: bytes, expected: int) -> None:
+    lines = data.splitlines()
+    assert len(lines) == expected
+    # Spot-check one record so a format break fails with a readable diff
+    assert json.loads(lines[0])["event_type"] == "test"
 
+    # One parse of the whole trace as a JSON array instead of one json.loads per line
+    events = json.loads(b"[" + b",".join(lines) + b"]")
+    assert all(event["event_type"] == "test" for event in events)
+
+
+def test_tracer_thread_safety_correctness(
+    thread_pool: ThreadPoolExecutor, fresh_tracer: Tracer
+) -> None:
+    sink = io.BytesIO()
+    fresh_tracer.configure(sink=sink)
+    _emit_concurrently(thread_pool, fresh_tracer, n_threads=4, n_events=25)
+    fresh_tracer.close()
+
+    _assert_all_events_written(sink.getvalue(), 4 * 25)
+
+
+def test_tracer_thread_safety_file(
+    thread_pool: ThreadPoolExecutor, fresh_tracer: Tracer, tmp_trace: Path
+) -> None:
+    # Default per-event flushing to a real file, as `sago watch` tails it
+    fresh_tracer.configure(tmp_trace)
+    _emit_concurrently(thread_pool, fresh_tracer, n_threads=4, n_events=25)
     fresh_tracer.close()
 
-    assert not errors
-    lines = tmp_trace.read_text().strip().splitlines()
-    assert len(lines) == n_threads * n_events
+    _assert_all_events_written(tmp_trace.read_bytes(), 4 * 25)
 
-    for line in lines:
-        parsed = json.loads(line)
-        assert parsed["event_type"] == "test"
+
+@pytest.mark.slow
+def test_tracer_thread_safety_stress(
+    thread_pool: ThreadPoolExecutor, fresh_tracer: Tracer, tmp_trace: Path
+) -> None:
+    # Goes through a real file so the buffered file path is exercised under load
+    fresh_tracer.configure(tmp_trace, write_buffer_bytes=65536)
+    _emit_concurrently(thread_pool, fresh_tracer, n_threads=10, n_events=50)
+    fresh_tracer.close()
+
+    _assert_all_events_written(tmp_trace.read_bytes(), 10 * 50)
+
+
+def test_tracer_configure_requires_one_target(fresh_tracer: Tracer, tmp_trace: Path) -> None:
+    with pytest.raises(ValueError, match="exactly one"):
+        fresh_tracer.configure()
+    with pytest.raises(ValueError, match="exactly one"):
+        fresh_tracer.configure(tmp_trace, sink=io.BytesIO())
+    assert not fresh_tracer.enabled
 
 
 def test_tracer_span_disabled(fresh_tracer: Tracer) -> None:
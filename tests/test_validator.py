@@ -126,6 +126,24 @@ class TestDependencyCycles:
         assert not result.valid
         assert any(i.code == "DEPENDENCY_CYCLE" for i in result.errors)
 
+    def test_long_chain_no_cycle(self, validator: PlanValidator) -> None:
+        tasks = [_task("1.0")] + [
+            _task(f"1.{i}", depends_on=[f"1.{i - 1}"]) for i in range(1, 2000)
+        ]
+        result = validator.validate(_plan(_phase("P1", *tasks)))
+        assert not any(i.code == "DEPENDENCY_CYCLE" for i in result.issues)
+
+    def test_repeated_dependency_no_cycle(self, validator: PlanValidator) -> None:
+        plan = _plan(
+            _phase(
+                "P1",
+                _task("1.1"),
+                _task("1.2", depends_on=["1.1", "1.1"]),
+            )
+        )
+        result = validator.validate(plan)
+        assert not any(i.code == "DEPENDENCY_CYCLE" for i in result.issues)
+
 
 class TestEmptyAction:
     def test_empty_action(self, validator: PlanValidator) -> None:
@@ -1,5 +1,8 @@
-import time
+import json
+import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -11,128 +14,149 @@ from sago.web.watcher import (
 )
 
 
-def _make_phases() -> list[Phase]:
-    """Create sample plan phases for testing."""
-    return [
-        Phase(
-            name="Phase 1: Foundation",
-            description="Set up project",
-            tasks=[
-                Task(
-                    id="1.1",
-                    name="Create config",
-                    files=["src/config.py"],
-                    action="Create config",
-                    verify="pytest",
-                    done="Done",
-                    phase_name="Phase 1: Foundation",
-                ),
-                Task(
-                    id="1.2",
-                    name="Create models",
-                    files=["src/models.py"],
-                    action="Create models",
-                    verify="pytest",
-                    done="Done",
-                    phase_name="Phase 1: Foundation",
-                ),
-            ],
-        ),
-        Phase(
-            name="Phase 2: API",
-            description="Build API",
-            tasks=[
-                Task(
-                    id="2.1",
-                    name="Create routes",
-                    files=["src/routes.py"],
-                    action="Create routes",
-                    verify="pytest",
-                    done="Done",
-                    phase_name="Phase 2: API",
-                ),
-            ],
-        ),
-    ]
+def _bump_mtime(path: Path, ns_delta: int = 10_000_000) -> None:
+    """Push *path*'s mtime forward so the watcher sees a change without sleeping."""
+    mtime_ns = path.stat().st_mtime_ns + ns_delta
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _json_missing(obj: object, tokens: list[str]) -> set[str]:
+    """Encode *obj* chunk by chunk and return the tokens no chunk contained.
+
+    The encoder is always run to the end so unserializable values still raise, but the
+    full JSON string is never built.
+    """
+    remaining = set(tokens)
+    for chunk in json.JSONEncoder().iterencode(obj):
+        if remaining:
+            remaining.difference_update([t for t in remaining if t in chunk])
+    return remaining
+
+
+# STATE.md marking only task 1.1 done, encoded once for the tests that write it
+_STATE_11_DONE = "[✓] 1.1: Create config\n".encode()
+
+# Phase and Task are frozen and the watcher only reads them, so tests share one plan.
+_PHASES: list[Phase] = [
+    Phase(
+        name="Phase 1: Foundation",
+        description="Set up project",
+        tasks=[
+            Task(
+                id="1.1",
+                name="Create config",
+                files=["src/config.py"],
+                action="Create config",
+                verify="pytest",
+                done="Done",
+                phase_name="Phase 1: Foundation",
+            ),
+            Task(
+                id="1.2",
+                name="Create models",
+                files=["src/models.py"],
+                action="Create models",
+                verify="pytest",
+                done="Done",
+                phase_name="Phase 1: Foundation",
+            ),
+        ],
+    ),
+    Phase(
+        name="Phase 2: API",
+        description="Build API",
+        tasks=[
+            Task(
+                id="2.1",
+                name="Create routes",
+                files=["src/routes.py"],
+                action="Create routes",
+                verify="pytest",
+                done="Done",
+                phase_name="Phase 2: API",
+            ),
+        ],
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def _project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal project directory, written once per module."""
+    path = tmp_path_factory.mktemp("watcher_template")
+    (path / "PROJECT.md").write_text("# Test Project\n")
+    (path / "REQUIREMENTS.md").write_text("# Requirements\n")
+    return path
 
 
 @pytest.fixture
-def project_dir(tmp_path: Path) -> Path:
-    """Create a minimal project directory."""
-    (tmp_path / "PROJECT.md").write_text("# Test Project\n")
-    (tmp_path / "REQUIREMENTS.md").write_text("# Requirements\n")
-    return tmp_path
-
-
-def test_poll_no_state_file(project_dir: Path) -> None:
-    """All tasks should be pending when STATE.md doesn't exist."""
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
-
-    state = watcher.poll()
-
-    assert state.progress.total == 3
-    assert state.progress.done == 0
-    assert state.progress.failed == 0
-    assert state.progress.pct == 0
-    assert all(t.status == "pending" for t in state.tasks)
+def project_dir(_project_template: Path, tmp_path: Path) -> Path:
+    """A per-test copy of the template, safe to write STATE.md and other files into."""
+    return Path(shutil.copytree(_project_template, tmp_path / "project"))
 
 
-def test_poll_empty_state_file(project_dir: Path) -> None:
-    """All tasks should be pending with empty STATE.md."""
-    (project_dir / "STATE.md").write_text("")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
-
-    state = watcher.poll()
+@pytest.fixture
+def watcher(project_dir: Path) -> ProjectWatcher:
+    """A watcher whose baseline is the untouched template copy.
 
-    assert state.progress.total == 3
-    assert state.progress.done == 0
-    assert all(t.status == "pending" for t in state.tasks)
+    Tests that need a file in the baseline write it first and build their own watcher.
+    """
+    return ProjectWatcher(project_path=project_dir, plan_phases=_PHASES)
 
 
-def test_poll_done_tasks(project_dir: Path) -> None:
-    """Done tasks should be detected from STATE.md."""
-    (project_dir / "STATE.md").write_text(
-        "# State\n\n[✓] 1.1: Create config\n[✓] 2.1: Create routes\n"
-    )
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
+@pytest.mark.parametrize(
+    ("state_text", "expected", "pct"),
+    [
+        pytest.param(
+            None, {"1.1": "pending", "1.2": "pending", "2.1": "pending"}, 0, id="no_state_file"
+        ),
+        pytest.param(
+            "", {"1.1": "pending", "1.2": "pending", "2.1": "pending"}, 0, id="empty_state_file"
+        ),
+        pytest.param(
+            "# State\n\n[✓] 1.1: Create config\n[✓] 2.1: Create routes\n",
+            {"1.1": "done", "1.2": "pending", "2.1": "done"},
+            67,
+            id="done_tasks",
+        ),
+        pytest.param(
+            "[✓] 1.1: Create config\n[✗] 1.2: Create models\n",
+            {"1.1": "done", "1.2": "failed", "2.1": "pending"},
+            33,
+            id="failed_tasks",
+        ),
+        pytest.param(
+            "[✓] 1.1: Create config\n[✓] 1.2: Create models\n[✓] 2.1: Create routes\n",
+            {"1.1": "done", "1.2": "done", "2.1": "done"},
+            100,
+            id="all_done",
+        ),
+    ],
+)
+def test_poll_task_progress(
+    project_dir: Path,
+    watcher: ProjectWatcher,
+    state_text: str | None,
+    expected: dict[str, str],
+    pct: int,
+) -> None:
+    """Task statuses and overall progress should follow the markers in STATE.md."""
+    if state_text is not None:
+        (project_dir / "STATE.md").write_text(state_text)
 
     state = watcher.poll()
 
-    assert state.progress.done == 2
+    assert {t.id: t.status for t in state.tasks} == expected
+    statuses = list(expected.values())
     assert state.progress.total == 3
-    assert state.progress.pct == 67
-
-    task_map = {t.id: t for t in state.tasks}
-    assert task_map["1.1"].status == "done"
-    assert task_map["1.2"].status == "pending"
-    assert task_map["2.1"].status == "done"
-
+    assert state.progress.done == statuses.count("done")
+    assert state.progress.failed == statuses.count("failed")
+    assert state.progress.pct == pct
 
-def test_poll_failed_tasks(project_dir: Path) -> None:
-    """Failed tasks should be detected from STATE.md."""
-    (project_dir / "STATE.md").write_text("[✓] 1.1: Create config\n[✗] 1.2: Create models\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
 
-    state = watcher.poll()
-
-    assert state.progress.done == 1
-    assert state.progress.failed == 1
-
-    task_map = {t.id: t for t in state.tasks}
-    assert task_map["1.1"].status == "done"
-    assert task_map["1.2"].status == "failed"
-    assert task_map["2.1"].status == "pending"
-
-
-def test_poll_phase_progress(project_dir: Path) -> None:
+def test_poll_phase_progress(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Phase progress should be calculated correctly."""
     (project_dir / "STATE.md").write_text("[✓] 1.1: Create config\n[✓] 1.2: Create models\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
 
     state = watcher.poll()
 
@@ -143,24 +167,20 @@ def test_poll_phase_progress(project_dir: Path) -> None:
     assert phase_map["Phase 2: API"].total == 1
 
 
-def test_file_change_detection(project_dir: Path) -> None:
+def test_file_change_detection(project_dir: Path, watcher: ProjectWatcher) -> None:
     """New files should appear in recent_files."""
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
-
     # No changes initially
     state = watcher.poll()
     assert len(state.recent_files) == 0
 
     # Create a tracked file (pyproject.toml is in _COMMON_ROOT_FILES)
-    time.sleep(0.05)  # ensure mtime differs
     (project_dir / "pyproject.toml").write_text("[project]\nname = 'test'\n")
 
     state = watcher.poll()
-    paths = [f.path for f in state.recent_files]
-    assert "pyproject.toml" in paths
+    recent = {f.path: f for f in state.recent_files}
+    assert "pyproject.toml" in recent
 
-    new_file = next(f for f in state.recent_files if f.path == "pyproject.toml")
+    new_file = recent["pyproject.toml"]
     assert new_file.is_new is True
     assert new_file.size > 0
 
@@ -170,18 +190,17 @@ def test_file_modification_detection(project_dir: Path) -> None:
     # Create the file first so it's in the baseline
     (project_dir / "README.md").write_text("# Hello\n")
 
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
+    watcher = ProjectWatcher(project_path=project_dir, plan_phases=_PHASES)
 
     # Modify after baseline
-    time.sleep(0.05)
     (project_dir / "README.md").write_text("# Hello World\nUpdated!\n")
+    _bump_mtime(project_dir / "README.md")
 
     state = watcher.poll()
-    paths = [f.path for f in state.recent_files]
-    assert "README.md" in paths
+    recent = {f.path: f for f in state.recent_files}
+    assert "README.md" in recent
 
-    mod_file = next(f for f in state.recent_files if f.path == "README.md")
+    mod_file = recent["README.md"]
     assert mod_file.is_new is False
 
 
@@ -207,11 +226,20 @@ def test_is_ignored() -> None:
     assert filt.is_ignored("README.md") is False
 
 
-def test_state_caching(project_dir: Path) -> None:
+def test_is_ignored_remembers_decisions() -> None:
+    """Repeated checks of a path are answered without re-matching the patterns."""
+    filt = _IgnoreFilter.from_patterns(["*.pyc"])
+
+    assert filt.is_ignored("test.pyc") is True
+    assert filt.is_ignored("src/main.py") is False
+    with patch.object(filt, "_matches", side_effect=AssertionError("re-matched")):
+        assert filt.is_ignored("test.pyc") is True
+        assert filt.is_ignored("src/main.py") is False
+
+
+def test_state_caching(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Watcher should cache STATE.md parsing until file changes."""
-    (project_dir / "STATE.md").write_text("[✓] 1.1: Create config\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
+    (project_dir / "STATE.md").write_bytes(_STATE_11_DONE)
 
     state1 = watcher.poll()
     state2 = watcher.poll()
@@ -221,125 +249,86 @@ def test_state_caching(project_dir: Path) -> None:
     assert state1.progress.done == state2.progress.done
 
 
-def test_poll_state_updates(project_dir: Path) -> None:
+def test_poll_state_updates(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Watcher should detect STATE.md changes between polls."""
-    (project_dir / "STATE.md").write_text("")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
+    (project_dir / "STATE.md").write_bytes(b"")
 
     state1 = watcher.poll()
     assert state1.progress.done == 0
 
     # Update STATE.md
-    time.sleep(0.05)
-    (project_dir / "STATE.md").write_text("[✓] 1.1: Create config\n")
+    (project_dir / "STATE.md").write_bytes(_STATE_11_DONE)
+    _bump_mtime(project_dir / "STATE.md")
 
     state2 = watcher.poll()
     assert state2.progress.done == 1
 
 
-def test_progress_100_percent(project_dir: Path) -> None:
-    """100% progress when all tasks are done."""
-    (project_dir / "STATE.md").write_text(
-        "[✓] 1.1: Create config\n[✓] 1.2: Create models\n[✓] 2.1: Create routes\n"
-    )
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
-
-    state = watcher.poll()
-
-    assert state.progress.done == 3
-    assert state.progress.total == 3
-    assert state.progress.pct == 100
-
-
-def test_to_dict_serialization(project_dir: Path) -> None:
+def test_to_dict_serialization(project_dir: Path, watcher: ProjectWatcher) -> None:
     """ProjectState.to_dict() should produce JSON-serializable output."""
-    import json
-
-    (project_dir / "STATE.md").write_text("[✓] 1.1: Create config\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
+    (project_dir / "STATE.md").write_bytes(_STATE_11_DONE)
 
     state = watcher.poll()
     d = state.to_dict()
 
     # Should be JSON-serializable without error
-    result = json.dumps(d)
-    assert "tasks" in result
-    assert "progress" in result
-    assert "phases" in result
-    assert "recent_files" in result
+    assert _json_missing(d, ["tasks", "progress", "phases", "recent_files"]) == set()
 
 
-def test_plan_file_tracking(project_dir: Path) -> None:
+def test_plan_file_tracking(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Files mentioned in plan tasks should be tracked."""
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
-
     # Create a plan-tracked file
     src_dir = project_dir / "src"
     src_dir.mkdir()
-    time.sleep(0.05)
     (src_dir / "config.py").write_text("# config\n")
 
     state = watcher.poll()
-    paths = [f.path for f in state.recent_files]
-    assert "src/config.py" in paths
+    recent = {f.path: f for f in state.recent_files}
+    assert "src/config.py" in recent
 
 
-def test_md_files_in_poll(project_dir: Path) -> None:
+def test_md_files_in_poll(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Poll should include md_files with content for existing .md files."""
     (project_dir / "PLAN.md").write_text("# Plan\n\n## Phase 1\n- Task A\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
 
     state = watcher.poll()
 
-    filenames = [m.filename for m in state.md_files]
+    md_files = {m.filename: m for m in state.md_files}
     # PROJECT.md and REQUIREMENTS.md were created by the fixture
-    assert "PROJECT.md" in filenames
-    assert "REQUIREMENTS.md" in filenames
-    assert "PLAN.md" in filenames
+    assert "PROJECT.md" in md_files
+    assert "REQUIREMENTS.md" in md_files
+    assert "PLAN.md" in md_files
     # STATE.md doesn't exist so it shouldn't appear
-    assert "STATE.md" not in filenames
+    assert "STATE.md" not in md_files
 
-    plan_md = next(m for m in state.md_files if m.filename == "PLAN.md")
+    plan_md = md_files["PLAN.md"]
     assert "# Plan" in plan_md.content
     assert plan_md.mtime > 0
 
 
-def test_md_files_caching(project_dir: Path) -> None:
+def test_md_files_caching(project_dir: Path, watcher: ProjectWatcher) -> None:
     """Md file content should be cached and only re-read when mtime changes."""
     (project_dir / "PLAN.md").write_text("# V1\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
 
     state1 = watcher.poll()
-    plan1 = next(m for m in state1.md_files if m.filename == "PLAN.md")
+    plan1 = {m.filename: m for m in state1.md_files}["PLAN.md"]
     assert "# V1" in plan1.content
 
     # Update the file
-    time.sleep(0.05)
     (project_dir / "PLAN.md").write_text("# V2\n")
+    _bump_mtime(project_dir / "PLAN.md")
 
     state2 = watcher.poll()
-    plan2 = next(m for m in state2.md_files if m.filename == "PLAN.md")
+    plan2 = {m.filename: m for m in state2.md_files}["PLAN.md"]
     assert "# V2" in plan2.content
 
 
-def test_md_files_serialization(project_dir: Path) -> None:
+def test_md_files_serialization(project_dir: Path, watcher: ProjectWatcher) -> None:
     """md_files should be included in to_dict() output."""
-    import json
-
     (project_dir / "PLAN.md").write_text("# Plan\n")
-    phases = _make_phases()
-    watcher = ProjectWatcher(project_path=project_dir, plan_phases=phases)
 
     state = watcher.poll()
     d = state.to_dict()
 
     assert "md_files" in d
-    result = json.dumps(d)
-    assert "md_files" in result
-    assert "PLAN.md" in result
+    assert _json_missing(d, ["md_files", "PLAN.md"]) == set()